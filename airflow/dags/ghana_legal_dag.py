@@ -1,7 +1,7 @@
 """Ghana Legal AI — Production ingestion pipeline.
 
 DAG flow:
-  discover_cases -> download_pdfs -> validate_pdfs -> extract_metadata -> ingest_to_qdrant -> generate_report
+  discover_cases -> batch_cases -> download_batch (mapped per batch) -> download_pdfs -> validate_pdfs -> extract_metadata -> ingest_to_qdrant -> generate_report
 
 Uses the unified ghalii.org/judgments/all/ listing to discover cases from all courts.
 Incremental: only new cases (not already in the manifest) are processed.
@@ -14,7 +14,7 @@ import logging
 import os
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from airflow.decorators import dag, task
 from airflow.exceptions import AirflowSkipException
@@ -25,6 +25,15 @@ PROJECT_ROOT = os.environ.get("PROJECT_ROOT", "/opt/airflow/dags/ghana_legal_roo
 DATA_DIR = os.path.join(PROJECT_ROOT, "data")
 MANIFEST_PATH = os.path.join(DATA_DIR, "pipeline_manifest.json")
 
+# Airflow pool bounding concurrent ghalii.org downloads (created by airflow-init)
+SCRAPE_POOL = "ghalii_scrape"
+SCRAPE_POOL_SLOTS = 6
+
+# Downloads are mapped per batch of cases, not per case: a first run or backfill
+# discovers thousands of cases, more than Airflow's [core] max_map_length (1024).
+DOWNLOAD_BATCH_SIZE = 25
+MAX_DOWNLOAD_BATCHES = 512
+
 default_args = {
     "owner": "ghana-legal-ai",
     "depends_on_past": False,
@@ -105,10 +114,24 @@ def ghana_legal_pipeline():
         return all_to_process
 
     @task()
-    def download_pdfs(case_ids: List[str]) -> List[str]:
-        """Download PDFs for discovered cases.
+    def batch_cases(case_ids: List[str]) -> List[List[str]]:
+        """Split the discovered case_ids into batches for download_batch.
 
-        Returns list of case_ids successfully downloaded.
+        Batches grow past DOWNLOAD_BATCH_SIZE when needed so the number of
+        mapped task instances never exceeds MAX_DOWNLOAD_BATCHES.
+        """
+        size = max(DOWNLOAD_BATCH_SIZE, -(-len(case_ids) // MAX_DOWNLOAD_BATCHES))
+        return [case_ids[i:i + size] for i in range(0, len(case_ids), size)]
+
+    @task(pool=SCRAPE_POOL, max_active_tis_per_dag=SCRAPE_POOL_SLOTS)
+    def download_batch(case_ids: List[str]) -> List[str]:
+        """Download the PDFs for one batch of discovered cases.
+
+        Mapped over the batches; the ``ghalii_scrape`` pool caps how many
+        batches hit ghalii.org at once. The manifest is only read here, since
+        concurrent writes would clobber each other.
+
+        Returns the case_ids whose PDF is on disk.
         """
         from ghana_legal_plugins.scraper import GhaliiScraper
         from ghana_legal_plugins.manifest import PipelineManifest
@@ -118,24 +141,50 @@ def ghana_legal_pipeline():
         downloaded = []
 
         for case_id in case_ids:
-            record = manifest.get_record(case_id)
-            if not record:
-                continue
+            # One bad case (unreadable record, disk error) must not fail the batch
+            try:
+                record = manifest.get_record(case_id)
+                if not record:
+                    continue
+
+                # Build output path: data/cases/<COURT_ID>/<case_id>.pdf
+                pdf_path = Path(DATA_DIR) / "cases" / record.court_id / f"{case_id}.pdf"
+
+                if pdf_path.exists():
+                    logger.info(f"Already downloaded: {case_id}")
+                    downloaded.append(case_id)
+                elif scraper.download_pdf(record.pdf_url, pdf_path):
+                    downloaded.append(case_id)
+            except Exception as e:
+                logger.error(f"Download failed for {case_id}: {e}")
+
+        return downloaded
 
-            # Build output path: data/cases/<COURT_ID>/<case_id>.pdf
-            court_dir = Path(DATA_DIR) / "cases" / record.court_id
-            pdf_path = court_dir / f"{case_id}.pdf"
+    @task(trigger_rule="all_done")
+    def download_pdfs(
+        case_ids: Optional[List[str]], results: List[Optional[List[str]]]
+    ) -> List[str]:
+        """Record the mapped download results in the manifest.
 
-            if pdf_path.exists():
-                logger.info(f"Already downloaded: {case_id}")
-                manifest.update_case(case_id, status="downloaded")
-                downloaded.append(case_id)
-                continue
+        Runs even when some download batches failed; cases without a result
+        are marked failed so they are retried on the next run.
 
-            success = scraper.download_pdf(record.pdf_url, pdf_path)
-            if success:
+        Returns list of case_ids successfully downloaded.
+        """
+        from ghana_legal_plugins.manifest import PipelineManifest
+
+        if not case_ids:
+            # discover_cases short-circuited; all_done would otherwise run us
+            raise AirflowSkipException("No cases were discovered.")
+
+        manifest = PipelineManifest(MANIFEST_PATH)
+        # Failed batches leave no XCom behind, so their cases are simply absent
+        succeeded = {case_id for batch in results or [] if batch for case_id in batch}
+        downloaded = [case_id for case_id in case_ids if case_id in succeeded]
+
+        for case_id in case_ids:
+            if case_id in succeeded:
                 manifest.update_case(case_id, status="downloaded")
-                downloaded.append(case_id)
             else:
                 manifest.update_case(case_id, status="failed", error="download_failed")
 
@@ -263,7 +312,8 @@ def ghana_legal_pipeline():
 
     # Wire up the DAG
     discovered = discover_cases()
-    downloaded = download_pdfs(discovered)
+    batches = batch_cases(discovered)
+    downloaded = download_pdfs(discovered, download_batch.expand(case_ids=batches))
     validated = validate_pdfs(downloaded)
     metadata = extract_metadata(validated)
     stats = ingest_to_qdrant(metadata)
@@ -1,20 +1,127 @@
 
-import os
+import json
 import re
+import threading
 import time
 import requests
 from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from urllib.parse import urljoin
+from requests.adapters import HTTPAdapter
+from urllib.parse import urljoin, urlparse
+from urllib3.util.retry import Retry
 from datetime import datetime
-from typing import List, Dict, Optional
+from email.utils import formatdate, parsedate_to_datetime
+from typing import List, Dict, Optional, Set, Tuple
+
+from ghana_legal_plugins.file_utils import atomic_write_json
 
 # Configuration
 BASE_URL = "https://ghalii.org"
 CASES_URL = "https://ghalii.org/judgments/GHASC/?q=&sort=-date"
+CASE_LINK_SELECTOR = "a[href*='/akn/gh/judgment/ghasc/']:not([href*='source'])"
+
+# Concurrency / politeness
+MAX_WORKERS = 6
+MIN_REQUEST_INTERVAL = 0.5  # Minimum seconds between requests to the same host
+CHUNK_SIZE = 64 * 1024
+
+# Record of already-downloaded case URLs, kept inside the output directory
+MANIFEST_NAME = ".manifest.json"
+
+# download_pdf outcomes; both are recorded in the manifest
+DOWNLOADED = "downloaded"
+ALREADY_PRESENT = "already_present"
+
+# Filename sanitisation patterns
+_UNSAFE = re.compile(r'[^\w\s-]')
+_SPACE = re.compile(r'\s+')
+
+
+def _make_session() -> requests.Session:
+    """Shared keep-alive session so downloads reuse pooled TCP/TLS connections."""
+    session = requests.Session()
+    retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504])
+    session.mount(
+        "https://",
+        HTTPAdapter(pool_connections=8, pool_maxsize=8, max_retries=retry),
+    )
+    return session
+
+
+class _HostThrottle:
+    """Caps in-flight requests and enforces a minimum interval per host."""
+
+    def __init__(self, max_concurrent: int = MAX_WORKERS, min_interval: float = MIN_REQUEST_INTERVAL):
+        self.min_interval = min_interval
+        self._semaphore = threading.Semaphore(max_concurrent)
+        self._lock = threading.Lock()
+        self._next_slot: Dict[str, float] = {}
+
+    def acquire(self, url: str):
+        self._semaphore.acquire()
+        host = urlparse(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.min_interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+    def release(self):
+        self._semaphore.release()
+
+
+_throttle = _HostThrottle()
+
+
+def _load_manifest(output_dir: Path) -> Dict[str, Dict]:
+    """Load the URL -> download record manifest, or an empty one."""
+    path = output_dir / MANIFEST_NAME
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError) as e:
+        print(f"⚠️  Ignoring unreadable manifest {path}: {e}")
+        return {}
 
-def get_case_links(page_url: str, max_cases: int = 10) -> List[Dict]:
-    """Extract case page links from the listing page."""
+
+def _save_manifest(output_dir: Path, manifest: Dict[str, Dict]):
+    atomic_write_json(output_dir / MANIFEST_NAME, manifest, indent=2)
+
+
+def _is_modified(http, url: str, filepath: Path, headers: dict) -> bool:
+    """Conditional HEAD: has the remote PDF changed since the local copy was written?"""
+    mtime = filepath.stat().st_mtime
+    try:
+        response = http.head(
+            url,
+            headers={**headers, "If-Modified-Since": formatdate(mtime, usegmt=True)},
+            timeout=10,
+            allow_redirects=True,
+        )
+    except Exception as e:
+        print(f"⚠️  HEAD failed for {url}: {e}")
+        return False
+
+    if response.status_code == 304:
+        return False
+    last_modified = response.headers.get("Last-Modified")
+    if last_modified:
+        try:
+            return parsedate_to_datetime(last_modified).timestamp() > mtime
+        except (TypeError, ValueError):
+            pass
+    return False
+
+def get_case_links(page_url: str, max_cases: int = 10, skip_urls: Optional[Set[str]] = None) -> List[Dict]:
+    """Extract case page links from the listing page.
+
+    URLs in ``skip_urls`` (already downloaded) are dropped before they count
+    towards ``max_cases``.
+    """
     print(f"📄 Fetching case listing from: {page_url}")
     
     headers = {
@@ -28,64 +135,77 @@ def get_case_links(page_url: str, max_cases: int = 10) -> List[Dict]:
         print(f"❌ Error fetching listing: {e}")
         return []
     
-    soup = BeautifulSoup(response.text, 'html.parser')
+    soup = BeautifulSoup(response.content, 'lxml')
     
-    cases = []
-    # Find all links that match the case URL pattern
-    for link in soup.find_all('a', href=True):
+    seen: set[str] = set(skip_urls or ())
+    cases: list[dict] = []
+    # Let the compiled selector filter case links instead of testing every <a>
+    for link in soup.select(CASE_LINK_SELECTOR):
         href = link['href']
-        if '/akn/gh/judgment/ghasc/' in href and 'source' not in href:
-            # Extract case info
-            case_text = link.get_text(strip=True)
-            if case_text and '[' in case_text:  # Valid case citation
-                cases.append({
-                    'url': urljoin(BASE_URL, href),
-                    'title': case_text,
-                    'pdf_url': urljoin(BASE_URL, href + '/source.pdf')
-                })
+        # Extract case info
+        case_text = link.get_text(strip=True)
+        if case_text and '[' in case_text:  # Valid case citation
+            full_url = urljoin(BASE_URL, href)
+            if full_url in seen:
+                continue
+            seen.add(full_url)
+            cases.append({
+                'url': full_url,
+                'title': case_text,
+                'pdf_url': urljoin(BASE_URL, href + '/source.pdf')
+            })
                 
         if len(cases) >= max_cases:
             break
     
-    # Remove duplicates
-    seen = set()
-    unique_cases = []
-    for case in cases:
-        if case['url'] not in seen:
-            seen.add(case['url'])
-            unique_cases.append(case)
-    
-    print(f"✅ Found {len(unique_cases)} unique cases")
-    return unique_cases
+    print(f"✅ Found {len(cases)} unique cases")
+    return cases
+
+def download_pdf(
+    case: dict, output_dir: Path, session: Optional[requests.Session] = None
+) -> Optional[Tuple[str, str]]:
+    """Download a single PDF.
 
-def download_pdf(case: dict, output_dir: Path) -> Optional[str]:
-    """Download a single PDF and return filepath if successful."""
+    Returns ``(DOWNLOADED, filepath)`` for a new download, ``(ALREADY_PRESENT,
+    filepath)`` when an unmodified copy is already on disk, or None on failure.
+    """
     # Create safe filename from title
-    safe_title = re.sub(r'[^\w\s-]', '', case['title'])[:80]
-    safe_title = re.sub(r'\s+', '_', safe_title)
+    safe_title = _UNSAFE.sub('', case['title'])[:80]
+    safe_title = _SPACE.sub('_', safe_title)
     filename = f"{safe_title}.pdf"
     filepath = output_dir / filename
     
-    if filepath.exists():
-        print(f"⏭️  Already exists: {filename}")
-        return None
-    
     headers = {
         "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) GhanaLegalAI/1.0"
     }
     
+    http = session or requests
+    _throttle.acquire(case['pdf_url'])
     try:
-        response = requests.get(case['pdf_url'], headers=headers, timeout=30)
-        if response.status_code == 200 and 'application/pdf' in response.headers.get('content-type', ''):
-            filepath.write_bytes(response.content)
-            print(f"✅ Downloaded: {filename} ({len(response.content) / 1024:.1f} KB)")
-            return str(filepath)
-        else:
-            print(f"❌ Failed: {filename} (Status: {response.status_code})")
-            return None
+        if filepath.exists() and not _is_modified(http, case['pdf_url'], filepath, headers):
+            print(f"⏭️  Already exists: {filename}")
+            return ALREADY_PRESENT, str(filepath)
+
+        with http.get(case['pdf_url'], headers=headers, timeout=30, stream=True) as response:
+            if response.status_code != 200 or 'application/pdf' not in response.headers.get('content-type', ''):
+                print(f"❌ Failed: {filename} (Status: {response.status_code})")
+                return None
+
+            # Stream to disk so peak memory is one chunk, not the whole PDF
+            written = 0
+            with open(filepath, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                    f.write(chunk)
+                    written += len(chunk)
+        print(f"✅ Downloaded: {filename} ({written / 1024:.1f} KB)")
+        return DOWNLOADED, str(filepath)
     except Exception as e:
+        # A partial PDF is newer than the remote copy, so _is_modified would keep it
+        filepath.unlink(missing_ok=True)
         print(f"❌ Error downloading {filename}: {e}")
         return None
+    finally:
+        _throttle.release()
 
 def fetch_new_cases(output_dir: str, limit: int = 10) -> List[str]:
     """
@@ -96,25 +216,42 @@ def fetch_new_cases(output_dir: str, limit: int = 10) -> List[str]:
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
     
-    cases = get_case_links(CASES_URL, max_cases=limit)
+    manifest = _load_manifest(output_path)
+    cases = get_case_links(CASES_URL, max_cases=limit, skip_urls=set(manifest))
     
     new_files = []
+    recorded = 0
     if not cases:
         print("❌ No cases found!")
         return []
     
     print(f"\n📥 Processing {len(cases)} candidates (Limit: {limit})...")
     
-    for i, case in enumerate(cases, 1):
-        if len(new_files) >= limit:
-            print(f"🛑 Limit of {limit} new files reached.")
-            break
-            
-        print(f"\n[{i}/{len(cases)}] {case['title'][:60]}...")
-        filepath = download_pdf(case, output_path)
-        if filepath:
-            new_files.append(filepath)
-        time.sleep(0.5)  # Be respectful
+    with _make_session() as session, ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+        futures = {ex.submit(download_pdf, c, output_path, session): c for c in cases}
+        for i, future in enumerate(as_completed(futures), 1):
+            case = futures[future]
+            print(f"\n[{i}/{len(cases)}] {case['title'][:60]}...")
+            result = future.result()
+            if result is None:
+                continue
+            status, filepath = result
+            # Record files that were already on disk too, so later runs skip
+            # them in the listing instead of re-HEADing them forever
+            manifest[case['url']] = {
+                'file': Path(filepath).name,
+                'downloaded_at': datetime.now().isoformat(),
+            }
+            recorded += 1
+            if status == DOWNLOADED:
+                new_files.append(filepath)
+            if len(new_files) >= limit:
+                print(f"🛑 Limit of {limit} new files reached.")
+                for pending in futures:
+                    pending.cancel()
+                break
     
+    if recorded:
+        _save_manifest(output_path, manifest)
     print(f"\n✅ Summary: {len(new_files)} new files downloaded.")
     return new_files
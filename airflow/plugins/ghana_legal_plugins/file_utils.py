@@ -0,0 +1,27 @@
+"""Small filesystem helpers shared by the pipeline plugins."""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+
+def atomic_write_json(path: Path, payload: Any, **dump_kwargs) -> None:
+    """Atomic save via tempfile + os.replace.
+
+    The payload is written to a temporary file next to ``path`` and renamed
+    over it, so readers never see a partial file. The temporary file is
+    removed if anything fails; the exception is re-raised.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(payload, f, **dump_kwargs)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
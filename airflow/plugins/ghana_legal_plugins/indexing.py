@@ -1,60 +1,53 @@
 
 import sys
 import os
+from contextlib import nullcontext
 from pathlib import Path
 from loguru import logger
 
+# Path resolution happens once at import.
+# Use the environment variable defined in docker-compose.yml
+_project_root_str = os.environ.get("PROJECT_ROOT")
+if _project_root_str:
+    PROJECT_ROOT = Path(_project_root_str)
+else:
+    # Fallback for local testing (relative path)
+    # airflow/plugins/ghana_legal_plugins/indexing.py -> ../../../
+    PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+LEGAL_API_SRC = PROJECT_ROOT / "legal-api" / "src"
+
+if str(LEGAL_API_SRC) not in sys.path:
+    sys.path.append(str(LEGAL_API_SRC))
+
+
 def index_new_cases():
     """
     Wrapper for the main Ingestion pipeline.
     This triggers the embedding and vector store update.
     Idempotency is handled by the ingest logic (checking existing IDs).
     """
-    # 1. Setup Path Resolution (Runtime)
-    # Use the environment variable defined in docker-compose.yml
-    project_root_str = os.environ.get("PROJECT_ROOT")
-
-    if project_root_str:
-        project_root = Path(project_root_str)
-    else:
-        # Fallback for local testing (relative path)
-        # airflow/plugins/ghana_legal/indexing.py -> ../../../
-        current_file = Path(__file__).resolve()
-        project_root = current_file.parents[3] 
-
-    legal_api_src = project_root / "legal-api" / "src"
-    
-    # 2. Debug Logging
-    logger.info(f"DEBUG: Project Root calculated as: {project_root}")
-    logger.info(f"DEBUG: Appending to sys.path: {legal_api_src}")
-    
-    if str(legal_api_src) not in sys.path:
-        sys.path.append(str(legal_api_src))
-        
-    # Check directory existence
-    if legal_api_src.exists():
-        try:
-            contents = os.listdir(legal_api_src)
-            logger.info(f"DEBUG: Contents of src: {contents}")
-            # Check specifically for ghana_legal package
-            if "ghana_legal" in contents:
-                logger.info("DEBUG: Found 'ghana_legal' package in src.")
-            else:
-                logger.error("DEBUG: 'ghana_legal' package NOT found in src!")
-        except Exception as e:
-             logger.error(f"DEBUG: Error listing src contents: {e}")
-    else:
-        logger.error(f"DEBUG: src directory NOT FOUND at {legal_api_src}")
-
-    # 3. Lazy Import & Execution
+    # Lazy import: Airflow's plugin scanner imports this module at startup,
+    # and ghana_legal pulls in the embedding/vector-store stack.
     try:
         from ghana_legal.application.data.ingest import ingest_data
+        from ghana_legal.application.rag.retrievers import get_retriever
+        from ghana_legal.config import settings
     except ImportError as e:
-        logger.error(f"Failed to import ghana_legal: {e}")
-        logger.error(f"Current sys.path: {sys.path}")
+        logger.error(f"Failed to import ghana_legal from {LEGAL_API_SRC}: {e}")
+        logger.debug(f"Current sys.path: {sys.path}")
         raise ImportError(f"Could not import ingest_data. Check Worker Logs. Error: {e}")
-        
+
     logger.info("Starting automated indexing of new cases...")
-    ingest_data()
+    # Same singleton ingest_data() will use; HNSW-backed stores expose
+    # bulk_ingest() so the graph is built once instead of per upsert.
+    retriever = get_retriever(
+        embedding_model_id=settings.RAG_TEXT_EMBEDDING_MODEL_ID,
+        k=settings.RAG_TOP_K,
+        device=settings.RAG_DEVICE,
+    )
+    bulk_ingest = getattr(retriever, "bulk_ingest", nullcontext)
+    with bulk_ingest():
+        ingest_data()
     logger.info("Indexing complete.")
     return "Indexing Successful"
@@ -139,8 +139,8 @@ def ingest_new_cases(pdf_paths: List[str], case_metadata: Dict[str, Dict]) -> Di
     chunked_docs = split_documents(documents)
     logger.info(f"Split {len(documents)} documents into {len(chunked_docs)} chunks")
 
-    # Upsert in batches
-    batch_size = 20
+    # Upsert in batches; each batch is a single embedding request
+    batch_size = 128
     successful = 0
     failed = 0
 
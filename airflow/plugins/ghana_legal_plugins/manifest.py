@@ -1,13 +1,13 @@
 """Pipeline manifest for tracking case processing state."""
 
 import json
-import os
-import tempfile
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from ghana_legal_plugins.file_utils import atomic_write_json
+
 
 @dataclass
 class CaseRecord:
@@ -51,20 +51,8 @@ class PipelineManifest:
                 self.cases[case_id] = CaseRecord(**record)
 
     def _save(self):
-        """Atomic save via tempfile + os.replace."""
-        self.path.parent.mkdir(parents=True, exist_ok=True)
         data = {"cases": {cid: asdict(rec) for cid, rec in self.cases.items()}}
-        fd, tmp_path = tempfile.mkstemp(
-            dir=str(self.path.parent), suffix=".tmp"
-        )
-        try:
-            with os.fdopen(fd, "w") as f:
-                json.dump(data, f, indent=2)
-            os.replace(tmp_path, str(self.path))
-        except Exception:
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
-            raise
+        atomic_write_json(self.path, data, indent=2)
 
     def add_case(self, record: CaseRecord) -> bool:
         """Add a case if not already tracked. Returns True if new."""
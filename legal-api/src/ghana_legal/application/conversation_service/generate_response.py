@@ -1,8 +1,11 @@
 import asyncio
+import contextvars
 import json
+import time
 import uuid
+import weakref
 import certifi
-from typing import Any, AsyncGenerator, Union
+from typing import Any, AsyncGenerator, AsyncIterator, Union
 
 from langchain_core.messages import AIMessage, AIMessageChunk, HumanMessage
 from langgraph.checkpoint.postgres import PostgresSaver
@@ -20,6 +23,100 @@ from ghana_legal.application.conversation_service.workflow.tools import (
 from ghana_legal.config import settings
 
 
+# One checkpointer pool + compiled graph per event loop, shared by every request
+# on that loop. psycopg pools are bound to the loop that opened them, and the
+# evaluation harness drives get_response through fresh asyncio.run() loops, so
+# the cache is keyed on the running loop rather than held as a bare global.
+# The pool holds references back to its loop, so entries are only released by
+# close_checkpointer(); every owner of a loop must call it before the loop ends.
+_graphs: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_pools: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_locks: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_tracers: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+# Streaming responses are flushed once this many characters are buffered or
+# this many seconds have passed since the last flush.
+STREAM_FLUSH_CHARS = 256
+STREAM_FLUSH_INTERVAL = 0.05
+
+# Connections kept open per checkpointer pool. Supabase's pooler caps client
+# connections, so idle pools stay small and only grow under concurrent turns.
+CHECKPOINTER_POOL_MIN_SIZE = 1
+CHECKPOINTER_POOL_MAX_SIZE = 4
+
+
+def _resolve_db_uri() -> str:
+    db_uri = settings.DATABASE_URL.replace("postgresql+asyncpg", "postgresql")
+    if "pooler.supabase.com" in db_uri and ":5432" in db_uri:
+        db_uri = db_uri.replace(":5432", ":6543")
+    return db_uri
+
+
+async def _get_compiled_graph():
+    """Return the checkpointed workflow graph for the running event loop.
+
+    The first call on a loop opens the Postgres connection pool, runs the
+    checkpointer's setup() migration and compiles the graph; later calls reuse
+    all three instead of paying a TCP+TLS handshake and compile per turn.
+    """
+    loop = asyncio.get_running_loop()
+    graph = _graphs.get(loop)
+    if graph is not None:
+        return graph
+
+    lock = _locks.setdefault(loop, asyncio.Lock())
+    async with lock:
+        graph = _graphs.get(loop)
+        if graph is None:
+            from psycopg_pool import AsyncConnectionPool
+            from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+
+            pool = AsyncConnectionPool(
+                conninfo=_resolve_db_uri(),
+                kwargs={"prepare_threshold": None},
+                min_size=CHECKPOINTER_POOL_MIN_SIZE,
+                max_size=CHECKPOINTER_POOL_MAX_SIZE,
+                open=False,
+            )
+            await pool.open()
+            checkpointer = AsyncPostgresSaver(pool)
+            await checkpointer.setup()
+            graph = create_workflow_graph().compile(checkpointer=checkpointer)
+            _pools[loop] = pool
+            _graphs[loop] = graph
+            logger.info("Compiled workflow graph with shared Postgres checkpointer")
+    return graph
+
+
+def _get_tracer(graph) -> OpikTracer:
+    """Return the OpikTracer for the running loop's compiled graph.
+
+    get_graph(xray=True) walks the whole StateGraph, so the tracer is built
+    once alongside the compiled graph rather than on every invocation.
+    """
+    loop = asyncio.get_running_loop()
+    tracer = _tracers.get(loop)
+    if tracer is None:
+        tracer = OpikTracer(graph=graph.get_graph(xray=True))
+        _tracers[loop] = tracer
+    return tracer
+
+
+async def close_checkpointer() -> None:
+    """Close the checkpointer pool opened on the running loop.
+
+    Called from the API lifespan on shutdown and by the evaluation harness at
+    the end of each per-sample loop.
+    """
+    loop = asyncio.get_running_loop()
+    _graphs.pop(loop, None)
+    _tracers.pop(loop, None)
+    pool = _pools.pop(loop, None)
+    if pool is not None:
+        await pool.close()
+
+
 async def get_response(
     messages: str | list[str] | list[dict[str, Any]],
     expert_id: str,
@@ -29,6 +126,7 @@ async def get_response(
     legal_context: str,
     new_thread: bool = False,
     clerk_id: str = "",
+    realtime_eval: bool = True,
 ) -> tuple[str, LegalExpertState]:
     """Run a conversation through the workflow graph.
 
@@ -39,6 +137,9 @@ async def get_response(
         expertise: Expert's area of legal focus.
         style: Style of conversation.
         legal_context: Additional context about the legal topic.
+        realtime_eval: Queue a background DeepEval evaluation of the reply.
+            The offline harness turns this off, since it scores every sample
+            itself.
 
     Returns:
         tuple[str, LegalExpertState]: A tuple containing:
@@ -49,63 +150,47 @@ async def get_response(
         RuntimeError: If there's an error running the conversation workflow.
     """
 
-    graph_builder = create_workflow_graph()
-
     try:
-        db_uri = settings.DATABASE_URL.replace("postgresql+asyncpg", "postgresql")
-        if "pooler.supabase.com" in db_uri and ":5432" in db_uri:
-            db_uri = db_uri.replace(":5432", ":6543")
-        
-        from psycopg_pool import AsyncConnectionPool
-        from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
-        
-        async with AsyncConnectionPool(conninfo=db_uri, kwargs={"prepare_threshold": None}) as pool:
-            checkpointer = AsyncPostgresSaver(pool)
-            await checkpointer.setup()
-            graph = graph_builder.compile(checkpointer=checkpointer)
-            opik_tracer = OpikTracer(graph=graph.get_graph(xray=True))
-
-            base_thread = f"{clerk_id}_{expert_id}" if clerk_id else expert_id
-            thread_id = (
-                base_thread if not new_thread else f"{base_thread}-{uuid.uuid4()}"
-            )
-            config = {
-                "configurable": {"thread_id": thread_id},
-                "callbacks": [opik_tracer],
-            }
-            output_state = await graph.ainvoke(
-                input={
-                    "messages": __format_messages(messages=messages),
-                    "expert_name": expert_name,
-                    "expertise": expertise,
-                    "style": style,
-                    "legal_context": legal_context,
-                    # Reset turn-scoped state so a prior turn's envelope or
-                    # retrieved docs cannot leak into this turn's validator
-                    # via the PostgresSaver checkpoint.
-                    "legal_answer": None,
-                    "retrieved": [],
-                    "repair_attempts": 0,
-                },
-                config=config,
-            )
+        graph = await _get_compiled_graph()
+        base_thread = f"{clerk_id}_{expert_id}" if clerk_id else expert_id
+        thread_id = (
+            base_thread if not new_thread else f"{base_thread}-{uuid.uuid4()}"
+        )
+        config = {
+            "configurable": {"thread_id": thread_id},
+            "callbacks": [_get_tracer(graph)],
+        }
+        output_state = await graph.ainvoke(
+            input={
+                "messages": __format_messages(messages=messages),
+                "expert_name": expert_name,
+                "expertise": expertise,
+                "style": style,
+                "legal_context": legal_context,
+                # Reset turn-scoped state so a prior turn's envelope or
+                # retrieved docs cannot leak into this turn's validator
+                # via the PostgresSaver checkpoint.
+                "legal_answer": None,
+                "retrieved": [],
+                "repair_attempts": 0,
+            },
+            config=config,
+        )
         last_message = output_state["messages"][-1]
         response_text = last_message.content
         
-        # Trigger async evaluation (non-blocking)
-        try:
-            from ghana_legal.application.evaluation.evaluation_service import get_evaluator
-            evaluator = get_evaluator()
-            asyncio.create_task(
-                evaluator.evaluate_and_log(
-                    query=messages if isinstance(messages, str) else str(messages),
+        # Queue evaluation for the background workers (non-blocking)
+        if realtime_eval:
+            try:
+                from ghana_legal.application.evaluation.evaluation_service import enqueue_evaluation
+                enqueue_evaluation(
+                    query=_flatten_query(messages),
                     response=response_text,
                     context=[legal_context] if legal_context else [],
                     expert_id=expert_id,
                 )
-            )
-        except Exception as eval_error:
-            logger.warning(f"Failed to start evaluation: {eval_error}")
+            except Exception as eval_error:
+                logger.warning(f"Failed to start evaluation: {eval_error}")
         
         return response_text, LegalExpertState(**output_state)
     except Exception as e:
@@ -140,130 +225,101 @@ async def get_streaming_response(
         RuntimeError: If there's an error running the conversation workflow.
     """
     clear_retrieved_sources()
-    graph_builder = create_workflow_graph()
 
     try:
-        db_uri = settings.DATABASE_URL.replace("postgresql+asyncpg", "postgresql")
-        if "pooler.supabase.com" in db_uri and ":5432" in db_uri:
-            db_uri = db_uri.replace(":5432", ":6543")
-
-        from psycopg_pool import AsyncConnectionPool
-        from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
-        
-        async with AsyncConnectionPool(conninfo=db_uri, kwargs={"prepare_threshold": None}) as pool:
-            checkpointer = AsyncPostgresSaver(pool)
-            await checkpointer.setup()
-            graph = graph_builder.compile(checkpointer=checkpointer)
-            opik_tracer = OpikTracer(graph=graph.get_graph(xray=True))
-
-            base_thread = f"{clerk_id}_{expert_id}" if clerk_id else expert_id
-            thread_id = (
-                base_thread if not new_thread else f"{base_thread}-{uuid.uuid4()}"
+        graph = await _get_compiled_graph()
+        base_thread = f"{clerk_id}_{expert_id}" if clerk_id else expert_id
+        thread_id = (
+            base_thread if not new_thread else f"{base_thread}-{uuid.uuid4()}"
+        )
+        config = {
+            "configurable": {"thread_id": thread_id},
+            "callbacks": [_get_tracer(graph)],
+        }
+
+        full_response = ""
+        stream = graph.astream(
+            input={
+                "messages": __format_messages(messages=messages),
+                "expert_name": expert_name,
+                "expertise": expertise,
+                "style": style,
+                "legal_context": legal_context,
+                # Reset turn-scoped state — see get_response above.
+                "legal_answer": None,
+                "retrieved": [],
+                "repair_attempts": 0,
+            },
+            config=config,
+            stream_mode="messages",
+        )
+        async for text in _coalesce(_answer_tokens(stream)):
+            full_response += text
+            yield text
+
+        # Pull final state to recover the structured LegalAnswer envelope.
+        # The structured-output answer pass does not yield AIMessageChunks,
+        # so full_response will be empty when retrieval ran successfully —
+        # we synthesize visible text from envelope.human_text below.
+        envelope = None
+        try:
+            snapshot = await graph.aget_state(config)
+            envelope = (snapshot.values or {}).get("legal_answer") if snapshot else None
+        except Exception as state_error:
+            logger.warning(f"Could not fetch final state for envelope: {state_error}")
+
+        # PR 4: refusal decision lives here (NOT in api.py) so streaming
+        # can flush chunks live instead of buffering an entire turn server-side
+        # to retroactively swap in a refusal — the buffering broke the SSE
+        # streaming experience entirely.
+        confidence = (envelope or {}).get("confidence")
+        refuse = confidence == "insufficient" or (
+            settings.REFUSE_BELOW == "low" and confidence == "low"
+        )
+
+        if refuse:
+            refusal_text = (
+                "I don't have enough grounded retrieved material to answer "
+                "this confidently. Please rephrase or ask about a different "
+                "Ghana legal topic."
             )
-            config = {
-                "configurable": {"thread_id": thread_id},
-                "callbacks": [opik_tracer],
+            envelope = {
+                "claims": [],
+                "holding": None,
+                "principle": None,
+                "human_text": refusal_text,
+                "retrieval_used": bool(get_retrieved_sources()),
+                "confidence": "insufficient",
             }
-
-            full_response = ""
-            async for chunk in graph.astream(
-                input={
-                    "messages": __format_messages(messages=messages),
-                    "expert_name": expert_name,
-                    "expertise": expertise,
-                    "style": style,
-                    "legal_context": legal_context,
-                    # Reset turn-scoped state — see get_response above.
-                    "legal_answer": None,
-                    "retrieved": [],
-                    "repair_attempts": 0,
-                },
-                config=config,
-                stream_mode="messages",
-            ):
-                msg, meta = chunk
-                if not isinstance(msg, AIMessageChunk):
-                    continue
-                # PR 6: only forward AIMessageChunks tagged as the text-answer
-                # pass. The router pass usually emits empty/tool-call chunks,
-                # and the structuring pass emits raw JSON tokens that should
-                # never reach the client. Tags are propagated through
-                # .with_config(tags=[...]) on the chains.
-                tags = meta.get("tags") or []
-                if "legal_expert_text_answer" not in tags:
-                    continue
-                content = msg.content or ""
-                if not content:
-                    continue
-                full_response += content
-                yield content
-
-            # Pull final state to recover the structured LegalAnswer envelope.
-            # The structured-output answer pass does not yield AIMessageChunks,
-            # so full_response will be empty when retrieval ran successfully —
-            # we synthesize visible text from envelope.human_text below.
-            envelope = None
-            try:
-                snapshot = await graph.aget_state(config)
-                envelope = (snapshot.values or {}).get("legal_answer") if snapshot else None
-            except Exception as state_error:
-                logger.warning(f"Could not fetch final state for envelope: {state_error}")
-
-            # PR 4: refusal decision lives here (NOT in api.py) so streaming
-            # can flush chunks live instead of buffering an entire turn server-side
-            # to retroactively swap in a refusal — the buffering broke the SSE
-            # streaming experience entirely.
-            confidence = (envelope or {}).get("confidence")
-            refuse = confidence == "insufficient" or (
-                settings.REFUSE_BELOW == "low" and confidence == "low"
+            if not full_response:
+                full_response = refusal_text
+                yield refusal_text
+        elif envelope and not full_response:
+            human_text = envelope.get("human_text", "") or ""
+            if human_text:
+                full_response = human_text
+                yield human_text
+
+        # Yield sources captured during retrieval
+        sources = get_retrieved_sources()
+        if sources:
+            yield json.dumps({"__sources__": sources})
+
+        # Yield the structured envelope marker (PR 2 dual-write).
+        if envelope:
+            yield json.dumps({"__envelope__": envelope})
+
+        # Queue evaluation for the background workers
+        try:
+            from ghana_legal.application.evaluation.evaluation_service import enqueue_evaluation
+            enqueue_evaluation(
+                query=_flatten_query(messages),
+                response=full_response,
+                context=[legal_context] if legal_context else [],
+                expert_id=expert_id,
             )
-
-            if refuse:
-                refusal_text = (
-                    "I don't have enough grounded retrieved material to answer "
-                    "this confidently. Please rephrase or ask about a different "
-                    "Ghana legal topic."
-                )
-                envelope = {
-                    "claims": [],
-                    "holding": None,
-                    "principle": None,
-                    "human_text": refusal_text,
-                    "retrieval_used": bool(get_retrieved_sources()),
-                    "confidence": "insufficient",
-                }
-                if not full_response:
-                    full_response = refusal_text
-                    yield refusal_text
-            elif envelope and not full_response:
-                human_text = envelope.get("human_text", "") or ""
-                if human_text:
-                    full_response = human_text
-                    yield human_text
-
-            # Yield sources captured during retrieval
-            sources = get_retrieved_sources()
-            if sources:
-                yield json.dumps({"__sources__": sources})
-
-            # Yield the structured envelope marker (PR 2 dual-write).
-            if envelope:
-                yield json.dumps({"__envelope__": envelope})
-
-            # Trigger async evaluation
-            try:
-                from ghana_legal.application.evaluation.evaluation_service import get_evaluator
-                evaluator = get_evaluator()
-                asyncio.create_task(
-                    evaluator.evaluate_and_log(
-                        query=messages if isinstance(messages, str) else str(messages),
-                        response=full_response,
-                        context=[legal_context] if legal_context else [],
-                        expert_id=expert_id,
-                    )
-                )
-            except Exception as eval_error:
-                logger.warning(f"Failed to start streaming evaluation: {eval_error}")
+        except Exception as eval_error:
+            logger.warning(f"Failed to start streaming evaluation: {eval_error}")
 
     except Exception as e:
         raise RuntimeError(
@@ -271,6 +327,98 @@ async def get_streaming_response(
         ) from e
 
 
+async def _answer_tokens(stream: AsyncIterator[tuple]) -> AsyncGenerator[str, None]:
+    """Yield the text-answer tokens from a stream_mode="messages" graph stream."""
+    async for msg, meta in stream:
+        if not isinstance(msg, AIMessageChunk):
+            continue
+        # PR 6: only forward AIMessageChunks tagged as the text-answer
+        # pass. The router pass usually emits empty/tool-call chunks,
+        # and the structuring pass emits raw JSON tokens that should
+        # never reach the client. Tags are propagated through
+        # .with_config(tags=[...]) on the chains.
+        tags = meta.get("tags") or []
+        if "legal_expert_text_answer" not in tags:
+            continue
+        content = msg.content or ""
+        if content:
+            yield content
+
+
+async def _coalesce(tokens: AsyncIterator[str]) -> AsyncGenerator[str, None]:
+    """Merge tokens into fewer SSE/WebSocket frames.
+
+    A frame is sent once STREAM_FLUSH_CHARS are buffered or STREAM_FLUSH_INTERVAL
+    has passed since the last one, including while the model pauses between
+    tokens. The first token arrives well after the start, so it is sent at once.
+    """
+    iterator = tokens.__aiter__()
+    # Reads run as tasks so a pause can be timed out without cancelling them.
+    # They share one context, copied back afterwards, so context variables the
+    # graph sets (e.g. retrieved sources) stay visible to the caller.
+    context = contextvars.copy_context()
+    loop = asyncio.get_running_loop()
+    buf: list[str] = []
+    buf_len = 0
+    last_flush = time.monotonic()
+    pending: asyncio.Future | None = None
+    try:
+        while True:
+            if pending is None:
+                pending = loop.create_task(iterator.__anext__(), context=context)
+            timeout = None
+            if buf:
+                timeout = max(0.0, STREAM_FLUSH_INTERVAL - (time.monotonic() - last_flush))
+            # asyncio.wait rather than wait_for: a timeout must not cancel the
+            # in-flight __anext__, which would abort the underlying stream
+            done, _ = await asyncio.wait({pending}, timeout=timeout)
+            if done:
+                try:
+                    token = pending.result()
+                except StopAsyncIteration:
+                    break
+                finally:
+                    pending = None
+                buf.append(token)
+                buf_len += len(token)
+                if buf_len < STREAM_FLUSH_CHARS and time.monotonic() - last_flush <= STREAM_FLUSH_INTERVAL:
+                    continue
+            yield "".join(buf)
+            buf.clear()
+            buf_len = 0
+            last_flush = time.monotonic()
+    finally:
+        if pending is not None:
+            pending.cancel()
+            await asyncio.gather(pending, return_exceptions=True)
+        for var, value in context.items():
+            var.set(value)
+
+    if buf:
+        yield "".join(buf)
+
+
+# Client-supplied roles -> LangChain message types. "system" is deliberately
+# absent: the system prompt comes from the expert's character card, not the client.
+_ROLE_CTOR = {"user": HumanMessage, "assistant": AIMessage}
+
+
+def _flatten_query(messages: str | list[str] | list[dict[str, Any]]) -> str:
+    """Join message contents into plain text for evaluation.
+
+    Avoids str(messages), which reprs every nested dict of a long history.
+    """
+    if isinstance(messages, str):
+        return messages
+    parts = []
+    for message in messages:
+        if isinstance(message, dict):
+            parts.append(message.get("content", ""))
+        else:
+            parts.append(str(message))
+    return "\n".join(parts)
+
+
 def __format_messages(
     messages: Union[str, list[dict[str, Any]]],
 ) -> list[Union[HumanMessage, AIMessage]]:
@@ -298,13 +446,12 @@ def __format_messages(
             and "role" in messages[0]
             and "content" in messages[0]
         ):
-            result = []
-            for msg in messages:
-                if msg["role"] == "user":
-                    result.append(HumanMessage(content=msg["content"]))
-                elif msg["role"] == "assistant":
-                    result.append(AIMessage(content=msg["content"]))
-            return result
+            # Unknown roles are dropped
+            return [
+                ctor(content=msg["content"])
+                for msg in messages
+                if (ctor := _ROLE_CTOR.get(msg["role"])) is not None
+            ]
 
         return [HumanMessage(content=message) for message in messages]
 
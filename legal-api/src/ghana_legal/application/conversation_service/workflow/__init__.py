@@ -1,9 +1,10 @@
 from .chains import get_legal_expert_response_chain, get_context_summary_chain, get_conversation_summary_chain
 from .graph import create_workflow_graph
-from .state import LegalExpertState, state_to_str
+from .state import LegalExpertState, state_summary, state_to_str
 
 __all__ = [
     "LegalExpertState",
+    "state_summary",
     "state_to_str",
     "get_legal_expert_response_chain",
     "get_context_summary_chain",
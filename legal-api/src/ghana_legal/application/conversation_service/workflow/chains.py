@@ -1,4 +1,11 @@
-from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
+import asyncio
+import weakref
+from typing import Literal
+
+import httpx
+from langchain_core.messages import HumanMessage, SystemMessage, convert_to_messages
+from langchain_core.prompt_values import ChatPromptValue
+from langchain_core.runnables import RunnableLambda
 from langchain_groq import ChatGroq
 from langchain_ollama import ChatOllama
 
@@ -11,6 +18,7 @@ from ghana_legal.domain.prompts import (
     LEGAL_EXPERT_CHARACTER_CARD,
     LEGAL_EXPERT_STRUCTURE_PROMPT,
     SUMMARY_PROMPT,
+    Prompt,
 )
 
 
@@ -23,32 +31,133 @@ TAG_STRUCTURE = "legal_expert_structure"
 TAG_ROUTER = "legal_expert_router"
 
 
-def get_chat_model(temperature: float = 0.7, model_name: str = None):
-    """Get the appropriate chat model based on configuration.
-    
-    If USE_LOCAL_LLM is True, uses local Ollama with fine-tuned LFM2.
-    Otherwise, uses Groq cloud API.
+def _compiled_prompt(
+    prompt: Prompt,
+    role: Literal["system", "human"],
+    history: Literal["before", "after"] | None = None,
+) -> RunnableLambda:
+    """Chat prompt backed by the Prompt's precompiled jinja2 template.
+
+    Stands in for ChatPromptTemplate(template_format="jinja2"), which builds a
+    new environment and reparses the template on every format. ``history``
+    places the ``messages`` input before or after the rendered message.
     """
-    if settings.USE_LOCAL_LLM:
-        return ChatOllama(
+    message_cls = SystemMessage if role == "system" else HumanMessage
+
+    def _format(inputs: dict) -> ChatPromptValue:
+        message = message_cls(content=prompt.render(**inputs))
+        if history is None:
+            return ChatPromptValue(messages=[message])
+        messages = convert_to_messages(inputs["messages"])
+        if history == "before":
+            return ChatPromptValue(messages=[*messages, message])
+        return ChatPromptValue(messages=[message, *messages])
+
+    return RunnableLambda(_format, name=f"{prompt.name}_prompt")
+
+
+# Prompt templates are static, so they are compiled once at import rather
+# than on every node execution.
+_LEGAL_EXPERT_PROMPT = _compiled_prompt(LEGAL_EXPERT_CHARACTER_CARD, "system", history="after")
+_STRUCTURE_PROMPT = _compiled_prompt(LEGAL_EXPERT_STRUCTURE_PROMPT, "system")
+_SUMMARY_PROMPT = _compiled_prompt(SUMMARY_PROMPT, "human", history="before")
+_EXTEND_SUMMARY_PROMPT = _compiled_prompt(EXTEND_SUMMARY_PROMPT, "human", history="before")
+_CONTEXT_SUMMARY_PROMPT = _compiled_prompt(CONTEXT_SUMMARY_PROMPT, "human")
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+# Per-loop HTTP client and chat models. The async clients' pooled connections
+# are bound to the loop that opened them, and the evaluation harness drives the
+# graph through a fresh asyncio.run() per sample. The clients reference their
+# loop, so entries are released by close_http_client(), not by the GC.
+_http_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_models: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+# Models built outside a running loop; ChatGroq then manages its own clients
+_unbound_models: dict[tuple, ChatGroq | ChatOllama] = {}
+
+
+def _get_http_client(loop: asyncio.AbstractEventLoop) -> httpx.AsyncClient:
+    """One keep-alive HTTP/2 connection pool per event loop, shared by all Groq models."""
+    client = _http_clients.get(loop)
+    if client is None:
+        client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+            timeout=60.0,
+        )
+        _http_clients[loop] = client
+    return client
+
+
+def _get_model(
+    loop: asyncio.AbstractEventLoop | None,
+    use_local: bool,
+    temperature: float,
+    model_name: str,
+) -> ChatGroq | ChatOllama:
+    """Build a chat model once per loop and configuration so its HTTP client is reused."""
+    models = _unbound_models if loop is None else _models.setdefault(loop, {})
+    key = (use_local, temperature, model_name)
+    model = models.get(key)
+    if model is not None:
+        return model
+
+    if use_local:
+        model = ChatOllama(
             base_url=settings.OLLAMA_BASE_URL,
-            model=settings.OLLAMA_MODEL,
+            model=model_name,
             temperature=temperature,
         )
     else:
-        return ChatGroq(
+        model = ChatGroq(
             api_key=settings.GROQ_API_KEY,
-            model_name=model_name or settings.GROQ_LLM_MODEL,
+            model_name=model_name,
             temperature=temperature,
+            **({"http_async_client": _get_http_client(loop)} if loop is not None else {}),
         )
+    models[key] = model
+    return model
+
+
+async def close_http_client() -> None:
+    """Close the Groq HTTP client opened on the running loop.
+
+    Called alongside close_checkpointer(): from the API lifespan on shutdown
+    and by the evaluation harness at the end of each per-sample loop.
+    """
+    loop = asyncio.get_running_loop()
+    _models.pop(loop, None)
+    client = _http_clients.pop(loop, None)
+    if client is not None:
+        await client.aclose()
+
+
+def get_chat_model(temperature: float = 0.7, model_name: str = None):
+    """Get the appropriate chat model based on configuration.
+    
+    If USE_LOCAL_LLM is True, uses local Ollama with fine-tuned LFM2.
+    Otherwise, uses Groq cloud API.
+    """
+    if settings.USE_LOCAL_LLM:
+        return _get_model(_running_loop(), True, temperature, settings.OLLAMA_MODEL)
+    return _get_model(
+        _running_loop(), False, temperature, model_name or settings.GROQ_LLM_MODEL
+    )
 
 
 def get_groq_model(temperature: float = 0.7, model_name: str = None) -> ChatGroq:
     """Always get Groq model (for summarization tasks)."""
-    return ChatGroq(
-        api_key=settings.GROQ_API_KEY,
-        model_name=model_name or settings.GROQ_LLM_MODEL_CONTEXT_SUMMARY,
-        temperature=temperature,
+    return _get_model(
+        _running_loop(),
+        False,
+        temperature,
+        model_name or settings.GROQ_LLM_MODEL_CONTEXT_SUMMARY,
     )
 
 
@@ -63,17 +172,8 @@ def get_legal_expert_response_chain():
     # Only bind tools if using Groq (Ollama may not support all tools)
     if not settings.USE_LOCAL_LLM:
         model = model.bind_tools(tools)
-    system_message = LEGAL_EXPERT_CHARACTER_CARD
-
-    prompt = ChatPromptTemplate.from_messages(
-        [
-            ("system", system_message.prompt),
-            MessagesPlaceholder(variable_name="messages"),
-        ],
-        template_format="jinja2",
-    )
 
-    return (prompt | model).with_config(tags=[TAG_ROUTER])
+    return (_LEGAL_EXPERT_PROMPT | model).with_config(tags=[TAG_ROUTER])
 
 
 def get_legal_expert_text_answer_chain():
@@ -90,14 +190,7 @@ def get_legal_expert_text_answer_chain():
     """
     model = get_chat_model()
     # NOT bind_tools — retrieval already happened, the model just answers.
-    prompt = ChatPromptTemplate.from_messages(
-        [
-            ("system", LEGAL_EXPERT_CHARACTER_CARD.prompt),
-            MessagesPlaceholder(variable_name="messages"),
-        ],
-        template_format="jinja2",
-    )
-    return (prompt | model).with_config(tags=[TAG_TEXT_ANSWER])
+    return (_LEGAL_EXPERT_PROMPT | model).with_config(tags=[TAG_TEXT_ANSWER])
 
 
 def get_legal_expert_structure_chain():
@@ -116,34 +209,18 @@ def get_legal_expert_structure_chain():
     if settings.USE_LOCAL_LLM:
         return None
 
-    model = ChatGroq(
-        api_key=settings.GROQ_API_KEY,
-        model_name=settings.GROQ_LLM_MODEL,  # 70b — instruction-following matters here
-        temperature=0,
-    )
+    # 70b — instruction-following matters here
+    model = get_groq_model(temperature=0, model_name=settings.GROQ_LLM_MODEL)
     structured = model.with_structured_output(LegalAnswer, method="json_schema")
 
-    prompt = ChatPromptTemplate.from_messages(
-        [("system", LEGAL_EXPERT_STRUCTURE_PROMPT.prompt)],
-        template_format="jinja2",
-    )
-
-    return (prompt | structured).with_config(tags=[TAG_STRUCTURE])
+    return (_STRUCTURE_PROMPT | structured).with_config(tags=[TAG_STRUCTURE])
 
 
 def get_conversation_summary_chain(summary: str = ""):
     # Always use Groq for summarization (better quality)
     model = get_groq_model(model_name=settings.GROQ_LLM_MODEL_CONTEXT_SUMMARY)
 
-    summary_message = EXTEND_SUMMARY_PROMPT if summary else SUMMARY_PROMPT
-
-    prompt = ChatPromptTemplate.from_messages(
-        [
-            MessagesPlaceholder(variable_name="messages"),
-            ("human", summary_message.prompt),
-        ],
-        template_format="jinja2",
-    )
+    prompt = _EXTEND_SUMMARY_PROMPT if summary else _SUMMARY_PROMPT
 
     return prompt | model
 
@@ -151,11 +228,5 @@ def get_conversation_summary_chain(summary: str = ""):
 def get_context_summary_chain():
     # Always use Groq for context summarization
     model = get_groq_model(model_name=settings.GROQ_LLM_MODEL_CONTEXT_SUMMARY)
-    prompt = ChatPromptTemplate.from_messages(
-        [
-            ("human", CONTEXT_SUMMARY_PROMPT.prompt),
-        ],
-        template_format="jinja2",
-    )
 
-    return prompt | model
\ No newline at end of file
+    return _CONTEXT_SUMMARY_PROMPT | model
\ No newline at end of file
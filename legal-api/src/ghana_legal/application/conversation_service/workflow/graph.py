@@ -1,5 +1,3 @@
-from functools import lru_cache
-
 from langgraph.graph import END, START, StateGraph
 from langgraph.prebuilt import tools_condition
 
@@ -16,7 +14,6 @@ from ghana_legal.application.conversation_service.workflow.nodes import (
 from ghana_legal.application.conversation_service.workflow.state import LegalExpertState
 
 
-@lru_cache(maxsize=1)
 def create_workflow_graph():
     graph_builder = StateGraph(LegalExpertState)
 
@@ -49,5 +46,6 @@ def create_workflow_graph():
 
     return graph_builder
 
+
 # Compiled without a checkpointer. Used for LangGraph Studio
 graph = create_workflow_graph().compile()
@@ -33,18 +33,21 @@ class LegalExpertState(MessagesState):
     repair_attempts: int
 
 
+def state_summary(state: LegalExpertState) -> dict:
+    """Return the fields that describe a state, without stringifying them."""
+    get = state.get
+
+    return {
+        "legal_context": get("legal_context", ""),
+        "expert_name": get("expert_name", ""),
+        "expertise": get("expertise", ""),
+        "style": get("style", ""),
+        # Prefer the running summary, then the raw messages.
+        "conversation": get("summary") or get("messages") or "",
+    }
+
+
 def state_to_str(state: LegalExpertState) -> str:
-    if "summary" in state and bool(state["summary"]):
-        conversation = state["summary"]
-    elif "messages" in state and bool(state["messages"]):
-        conversation = state["messages"]
-    else:
-        conversation = ""
-
-    return f"""
-LegalExpertState(legal_context={state.get("legal_context", "")}, 
-expert_name={state.get("expert_name", "")}, 
-expertise={state.get("expertise", "")}, 
-style={state.get("style", "")}, 
-conversation={conversation})
-        """
+    fields = ", \n".join(f"{key}={value}" for key, value in state_summary(state).items())
+
+    return f"\nLegalExpertState({fields})\n"
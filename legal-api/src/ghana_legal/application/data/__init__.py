@@ -1,4 +1,4 @@
 from .deduplicate_documents import deduplicate_documents
-from .extract import get_extraction_generator
+from .extract import aget_extraction_generator, get_extraction_generator
 
-__all__ = ["get_extraction_generator", "deduplicate_documents"]
+__all__ = ["get_extraction_generator", "aget_extraction_generator", "deduplicate_documents"]
@@ -1,23 +1,41 @@
+import asyncio
+import hashlib
+import json
 import logging
-from typing import Generator
+import time
+from pathlib import Path
+from typing import AsyncGenerator, Generator
 
-from langchain_community.document_loaders import WebBaseLoader, WikipediaLoader
+import httpx
+from langchain_community.document_loaders import WikipediaLoader
 from langchain_core.documents import Document
+from selectolax.lexbor import LexborHTMLParser
 from tqdm import tqdm
 
+from ghana_legal.config import settings
 from ghana_legal.domain.legal_expert import LegalExpert, LegalExpertExtract
 from ghana_legal.domain.legal_expert_factory import LegalExpertFactory
+from ghana_legal.infrastructure.file_utils import atomic_write_json
 from ghana_legal.infrastructure.parsing.legal_parser import LegalDocumentLoader
 
 
 logger = logging.getLogger(__name__)
 
+# Max URL scrapes in flight at once across all experts
+MAX_CONCURRENCY = 5
+# Max experts extracted ahead of the consumer
+MAX_PREFETCH = 2
+USER_AGENT = "Mozilla/5.0 (compatible; GhanaLegalAI/1.0)"
+
 
 def get_extraction_generator(
     experts: list[LegalExpertExtract],
 ) -> Generator[tuple[LegalExpert, list[Document]], None, None]:
     """Extract documents for a list of legal experts, yielding one at a time.
 
+    Sync facade over aget_extraction_generator() for callers outside an
+    event loop. Experts are yielded in completion order.
+
     Args:
         experts: A list of LegalExpertExtract objects containing expert information.
 
@@ -26,8 +44,43 @@ def get_extraction_generator(
             documents extracted for that expert.
     """
 
+    loop = asyncio.new_event_loop()
+    agen = aget_extraction_generator(experts)
+    try:
+        while True:
+            try:
+                yield loop.run_until_complete(agen.__anext__())
+            except StopAsyncIteration:
+                break
+    finally:
+        loop.run_until_complete(agen.aclose())
+        loop.run_until_complete(loop.shutdown_default_executor())
+        loop.close()
+
+
+async def aget_extraction_generator(
+    experts: list[LegalExpertExtract],
+    max_concurrency: int = MAX_CONCURRENCY,
+    max_prefetch: int = MAX_PREFETCH,
+) -> AsyncGenerator[tuple[LegalExpert, list[Document]], None]:
+    """Extract documents for all experts concurrently, yielding as each finishes.
+
+    Extraction keeps running while the consumer processes earlier experts,
+    but at most ``max_prefetch`` experts are extracted or waiting ahead of
+    it, which bounds how many document sets are held in memory.
+
+    Args:
+        experts: A list of LegalExpertExtract objects containing expert information.
+        max_concurrency: Max URL scrapes in flight at once.
+        max_prefetch: Max experts extracted ahead of the consumer.
+
+    Yields:
+        tuple[LegalExpert, list[Document]]: A tuple containing the legal expert object and a list of
+            documents extracted for that expert.
+    """
+
     progress_bar = tqdm(
-        experts,
+        total=len(experts),
         desc="Extracting docs",
         unit="expert",
         bar_format="{desc}: {percentage:3.0f}%|{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}] {postfix}",
@@ -37,80 +90,162 @@ def get_extraction_generator(
     )
 
     expert_factory = LegalExpertFactory()
-    for expert_extract in progress_bar:
-        expert = expert_factory.get_legal_expert(expert_extract.id)
-        progress_bar.set_postfix_str(f"Expert: {expert.name}")
-
-        expert_docs = extract(expert, expert_extract.urls)
-
-        yield (expert, expert_docs)
-
-
-def extract(expert: LegalExpert, extract_urls: list[str]) -> list[Document]:
+    sem = asyncio.Semaphore(max_concurrency)
+    prefetch = asyncio.Semaphore(max_prefetch)
+    # Shared across experts so each local directory is parsed once per run
+    loader = LegalDocumentLoader()
+    # One client per pipeline run keeps TCP/TLS connections warm across URLs
+    async with httpx.AsyncClient(
+        headers={"User-Agent": USER_AGENT}, follow_redirects=True, timeout=30.0
+    ) as client:
+
+        async def _extract_one(expert_extract: LegalExpertExtract):
+            # Released once the consumer asks for the next expert
+            await prefetch.acquire()
+            expert = expert_factory.get_legal_expert(expert_extract.id)
+            docs = await extract_async(expert, expert_extract.urls, client, sem, loader)
+            return expert, docs
+
+        tasks = [asyncio.create_task(_extract_one(e)) for e in experts]
+        try:
+            for future in asyncio.as_completed(tasks):
+                expert, expert_docs = await future
+                progress_bar.set_postfix_str(f"Expert: {expert.name}")
+                progress_bar.update()
+
+                yield (expert, expert_docs)
+                prefetch.release()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            progress_bar.close()
+
+
+async def extract_async(
+    expert: LegalExpert,
+    extract_urls: list[str],
+    client: httpx.AsyncClient,
+    sem: asyncio.Semaphore,
+    loader: LegalDocumentLoader | None = None,
+) -> list[Document]:
     """Extract documents for a single legal expert from all sources.
 
+    Local parsing and the Wikipedia lookup run in worker threads while the
+    URLs are scraped concurrently.
+
     Args:
         expert: LegalExpert object containing expert information.
         extract_urls: List of URLs to extract content from.
+        client: Shared HTTP client for URL scraping.
+        sem: Semaphore bounding concurrent URL scrapes.
+        loader: Local document loader to reuse; a fresh one is used if None.
 
     Returns:
         list[Document]: List of documents extracted for the expert.
     """
 
-    docs = []
+    local_docs, wiki_docs, web_docs = await asyncio.gather(
+        # 1. Parse local legal documents (Constitution, Court Cases, etc.)
+        asyncio.to_thread(extract_local_documents, expert, loader),
+        # 2. Add Wikipedia/Web sources as supplementary
+        asyncio.to_thread(extract_wikipedia_legal, expert),
+        extract_web_sources(expert, extract_urls, client, sem),
+    )
+
+    return local_docs + wiki_docs + web_docs
 
-    # 1. Parse local legal documents (Constitution, Court Cases, etc.)
+
+def extract_local_documents(
+    expert: LegalExpert, loader: LegalDocumentLoader | None = None
+) -> list[Document]:
+    """Load the local legal documents (Constitution, court cases, ...) for an expert."""
     logger.info(f"Loading local documents for {expert.name}...")
     try:
-        loader = LegalDocumentLoader()
-        local_docs = loader.load_expert_documents(expert.id, expert.name)
-        docs.extend(local_docs)
+        loader = loader or LegalDocumentLoader()
+        return loader.load_expert_documents(expert.id, expert.name)
     except Exception as e:
         logger.error(f"Error loading local documents: {e}")
+        return []
 
-    # 2. Add Wikipedia/Web sources as supplementary
-    docs.extend(extract_wikipedia_legal(expert))
-    docs.extend(extract_web_sources(expert, extract_urls))
 
-    return docs
+def _wikipedia_cache_path(query: str, lang: str) -> Path:
+    key = hashlib.sha256(f"{lang}:{query}".encode("utf-8")).hexdigest()
+    return settings.WIKIPEDIA_CACHE_DIR / f"{key}.json"
+
+
+def _load_wikipedia_cache(path: Path) -> list[Document] | None:
+    """Return the cached pages for a query, or None if missing or expired."""
+    try:
+        age = time.time() - path.stat().st_mtime
+        if age > settings.WIKIPEDIA_CACHE_TTL_DAYS * 24 * 3600:
+            return None
+        return [Document(**doc) for doc in json.loads(path.read_text())]
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, TypeError) as e:
+        logger.warning(f"Ignoring unreadable Wikipedia cache {path}: {e}")
+        return None
+
+
+def _save_wikipedia_cache(path: Path, docs: list[Document]) -> None:
+    payload = [{"page_content": d.page_content, "metadata": d.metadata} for d in docs]
+    try:
+        atomic_write_json(path, payload, default=str)
+    except OSError as e:
+        logger.warning(f"Failed to write Wikipedia cache {path}: {e}")
 
 
 def extract_wikipedia_legal(expert: LegalExpert) -> list[Document]:
     """Extract documents for a single legal expert context from Wikipedia.
 
+    Pages are cached on disk for WIKIPEDIA_CACHE_TTL_DAYS, so repeat ingests
+    don't re-download them.
+
     Args:
         expert: LegalExpert object.
 
     Returns:
         list[Document]: List of documents extracted from Wikipedia.
     """
-    try:
-        loader = WikipediaLoader(
-            query=expert.name + " Ghana Law", # Append context to search
-            lang="en",
-            load_max_docs=1,
-            doc_content_chars_max=1000000,
-        )
-        docs = loader.load()
-
-        for doc in docs:
-            doc.metadata["expert_id"] = expert.id
-            doc.metadata["expert_name"] = expert.name
-        
-        return docs
-    except Exception:
-        # Fallback if specific page not found
-        return []
+    query = expert.name + " Ghana Law"  # Append context to search
+    cache_path = _wikipedia_cache_path(query, "en")
+
+    docs = _load_wikipedia_cache(cache_path)
+    if docs is None:
+        try:
+            loader = WikipediaLoader(
+                query=query,
+                lang="en",
+                load_max_docs=1,
+                doc_content_chars_max=1000000,
+            )
+            docs = loader.load()
+        except Exception:
+            # Fallback if specific page not found
+            return []
+        _save_wikipedia_cache(cache_path, docs)
+
+    for doc in docs:
+        doc.metadata["expert_id"] = expert.id
+        doc.metadata["expert_name"] = expert.name
+
+    return docs
 
 
-def extract_web_sources(
-    expert: LegalExpert, urls: list[str]
+async def extract_web_sources(
+    expert: LegalExpert,
+    urls: list[str],
+    client: httpx.AsyncClient,
+    sem: asyncio.Semaphore,
 ) -> list[Document]:
     """Extract documents from provided URLs.
 
     Args:
         expert: LegalExpert object.
         urls: List of URLs to extract content from.
+        client: Shared HTTP client.
+        sem: Semaphore bounding concurrent requests.
 
     Returns:
         list[Document]: List of documents extracted from URLs.
@@ -119,26 +254,35 @@ def extract_web_sources(
     if len(urls) == 0:
         return []
 
-    loader = WebBaseLoader(show_progress=False)
-    soups = loader.scrape_all(urls)
-
-    documents = []
-    for url, soup in zip(urls, soups):
+    async def _fetch(url: str) -> Document | None:
+        async with sem:
+            try:
+                response = await client.get(url)
+                response.raise_for_status()
+            except httpx.HTTPError as e:
+                logger.error(f"Error scraping {url}: {e}")
+                return None
+
+        # C-backed lexbor parser; script/style bodies are dropped from the text
+        tree = LexborHTMLParser(response.text)
+        tree.strip_tags(["script", "style", "noscript"])
+        title = tree.css_first("title")
         # Basic text extraction
-        text = soup.get_text(separator="\n\n", strip=True)
-        
+        text = tree.root.text(separator="\n\n", strip=True) if tree.root else ""
+
         metadata = {
             "source": url,
             "expert_id": expert.id,
             "expert_name": expert.name,
         }
 
-        if title := soup.find("title"):
-            metadata["title"] = title.get_text().strip(" \n")
+        if title:
+            metadata["title"] = title.text().strip(" \n")
 
-        documents.append(Document(page_content=text, metadata=metadata))
+        return Document(page_content=text, metadata=metadata)
 
-    return documents
+    documents = await asyncio.gather(*(_fetch(url) for url in urls))
+    return [doc for doc in documents if doc is not None]
 
 
 if __name__ == "__main__":
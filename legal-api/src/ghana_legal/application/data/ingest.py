@@ -3,9 +3,16 @@ from loguru import logger
 from ghana_legal.application.long_term_memory import LongTermMemoryCreator
 from ghana_legal.domain.legal_expert_factory import LegalExpertFactory
 from ghana_legal.domain.legal_expert import LegalExpertExtract
+from ghana_legal.infrastructure.async_utils import run_async
+
 
 def ingest_data():
     """Run the ingestion pipeline to populate the vector database."""
+    run_async(ingest_data_async())
+
+
+async def ingest_data_async():
+    """Ingest every expert concurrently; see LongTermMemoryCreator.acall."""
     logger.info("Starting ingestion...")
     
     # 1. Get all legal experts using factory static methods
@@ -21,7 +28,7 @@ def ingest_data():
     creator = LongTermMemoryCreator.build_from_settings()
     
     # 3. Run Ingestion
-    creator(expert_extracts)
+    await creator.acall(expert_extracts)
     
     logger.info("Ingestion complete.")
 
@@ -5,6 +5,9 @@ from .evaluation_service import (
     RealTimeEvaluator,
     EvaluationResult,
     get_evaluator,
+    enqueue_evaluation,
+    start_eval_workers,
+    stop_eval_workers,
 )
 
 __all__ = [
@@ -14,4 +17,7 @@ __all__ = [
     "RealTimeEvaluator",
     "EvaluationResult",
     "get_evaluator",
+    "enqueue_evaluation",
+    "start_eval_workers",
+    "stop_eval_workers",
 ]
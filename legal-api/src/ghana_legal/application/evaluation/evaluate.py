@@ -1,4 +1,5 @@
-import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 import opik
 from loguru import logger
@@ -11,10 +12,24 @@ from opik.evaluation.metrics import (
     Moderation,
 )
 
-from ghana_legal.application.conversation_service.generate_response import get_response
+from ghana_legal.application.conversation_service.generate_response import (
+    close_checkpointer,
+    get_response,
+)
+from ghana_legal.application.conversation_service.workflow.chains import (
+    close_http_client,
+)
 from ghana_legal.application.conversation_service.workflow.state import state_to_str
 from ghana_legal.config import settings
 from ghana_legal.domain.legal_expert_factory import LegalExpertFactory
+from ghana_legal.infrastructure.async_utils import run_async
+from ghana_legal.infrastructure.opik_utils import get_opik_client
+
+USED_PROMPT_NAMES = (
+    "legal_expert_character_card",
+    "summary_prompt",
+    "extend_summary_prompt",
+)
 
 
 async def evaluation_task(x: dict) -> dict:
@@ -40,15 +55,22 @@ async def evaluation_task(x: dict) -> dict:
     input_messages = x["messages"][:-1]
     expected_output_message = x["messages"][-1]
 
-    response, latest_state = await get_response(
-        messages=input_messages,
-        expert_id=expert.id,
-        expert_name=expert.name,
-        expertise=expert.expertise,
-        style=expert.style,
-        legal_context="",
-        new_thread=True,
-    )
+    try:
+        response, latest_state = await get_response(
+            messages=input_messages,
+            expert_id=expert.id,
+            expert_name=expert.name,
+            expertise=expert.expertise,
+            style=expert.style,
+            legal_context="",
+            new_thread=True,
+            # The Opik metrics below score every sample; skip the real-time judge
+            realtime_eval=False,
+        )
+    finally:
+        # Each sample runs on its own loop; release that loop's pool and HTTP client
+        await close_checkpointer()
+        await close_http_client()
     context = state_to_str(latest_state)
 
     return {
@@ -59,14 +81,15 @@ async def evaluation_task(x: dict) -> dict:
     }
 
 
+@lru_cache(maxsize=1)
 def get_used_prompts() -> list[opik.Prompt]:
-    client = opik.Opik()
+    """Fetch the versioned prompts once per process, in parallel."""
+    client = get_opik_client()
 
-    prompts = [
-        client.get_prompt(name="legal_expert_character_card"),
-        client.get_prompt(name="summary_prompt"),
-        client.get_prompt(name="extend_summary_prompt"),
-    ]
+    with ThreadPoolExecutor(max_workers=len(USED_PROMPT_NAMES)) as executor:
+        prompts = list(
+            executor.map(lambda name: client.get_prompt(name=name), USED_PROMPT_NAMES)
+        )
     prompts = [p for p in prompts if p is not None]
 
     return prompts
@@ -127,7 +150,7 @@ def evaluate_agent(
 
     evaluate(
         dataset=dataset,
-        task=lambda x: asyncio.run(evaluation_task(x)),
+        task=lambda x: run_async(evaluation_task(x)),
         scoring_metrics=scoring_metrics,
         experiment_config=experiment_config,
         task_threads=workers,
@@ -7,14 +7,15 @@ Evaluations are non-blocking - user gets response immediately while evaluation
 runs in background.
 
 Usage:
-    evaluator = RealTimeEvaluator()
-    asyncio.create_task(evaluator.evaluate_and_log(...))
+    enqueue_evaluation(query=..., response=..., context=[...], expert_id=...)
 """
 
 import asyncio
+import itertools
+import queue
+import weakref
 from dataclasses import dataclass
 from typing import Optional
-import random
 
 from loguru import logger
 
@@ -41,6 +42,17 @@ except ImportError:
 from ghana_legal.config import settings
 
 
+# Metric constructors; instances are built lazily and reused across evaluations
+_METRIC_FACTORIES = {
+    "faithfulness": lambda: FaithfulnessMetric(threshold=0.6),
+    "relevancy": lambda: AnswerRelevancyMetric(threshold=0.6),
+    "hallucination": lambda: HallucinationMetric(threshold=0.6),
+    "legal_accuracy": lambda: LegalAccuracyMetric(threshold=0.7),
+    "legal_relevance": lambda: LegalRelevanceMetric(threshold=0.6),
+    "legal_authority": lambda: LegalAuthorityMetric(threshold=0.5),
+}
+
+
 @dataclass
 class EvaluationResult:
     """Results from real-time evaluation."""
@@ -105,6 +117,16 @@ class EvaluationResult:
         return {k: v for k, v in result.items() if v is not None or k == "error"}
 
 
+# Shared result for sampled-out queries, so skipping allocates nothing and
+# does not keep the query/response alive. Treat as read-only.
+_SKIPPED_SENTINEL = EvaluationResult(
+    query="",
+    response="",
+    expert_id="",
+    evaluation_error="Skipped due to sampling",
+)
+
+
 class RealTimeEvaluator:
     """
     Runs DeepEval metrics on responses asynchronously.
@@ -131,16 +153,57 @@ class RealTimeEvaluator:
             enable_hallucination: Whether to run hallucination metric.
         """
         self.sample_rate = sample_rate
+        # Deterministic sampling: evaluate every Nth query. next() on
+        # itertools.count is atomic under the GIL, so no lock is needed.
+        self._sample_every = max(1, round(1.0 / sample_rate)) if 0 < sample_rate < 1 else 1
+        self._counter = itertools.count()
         self.enable_faithfulness = enable_faithfulness
         self.enable_relevancy = enable_relevancy
         self.enable_hallucination = enable_hallucination
         
+        # Reusable metric sets, one checked out per in-flight evaluation
+        self._metric_pool: queue.SimpleQueue = queue.SimpleQueue()
+
         if not DEEPEVAL_AVAILABLE:
             logger.warning("DeepEval not available. Evaluations will be skipped.")
     
+    def warmup(self) -> None:
+        """Build one metric set up front and park it in the pool.
+
+        Metric constructors set up their model clients on first use; doing it
+        at startup keeps that cost off the first evaluated query.
+        """
+        if not DEEPEVAL_AVAILABLE or self.sample_rate <= 0:
+            return
+
+        names = [
+            name
+            for name, enabled in (
+                ("faithfulness", self.enable_faithfulness),
+                ("relevancy", self.enable_relevancy),
+                ("hallucination", self.enable_hallucination),
+            )
+            if enabled
+        ]
+        if LEGAL_METRICS_AVAILABLE:
+            names += ["legal_accuracy", "legal_relevance", "legal_authority"]
+
+        metrics = {}
+        try:
+            for name in names:
+                self._metric(metrics, name)
+        except Exception as e:
+            logger.warning(f"Evaluation metric warmup failed: {e}")
+        self._metric_pool.put(metrics)
+        logger.info(f"Warmed up {len(metrics)} evaluation metric(s)")
+
     def should_evaluate(self) -> bool:
         """Determine if this query should be evaluated based on sample rate."""
-        return random.random() < self.sample_rate
+        if self.sample_rate <= 0:
+            return False
+        if self.sample_rate >= 1.0:
+            return True
+        return next(self._counter) % self._sample_every == 0
     
     async def evaluate_and_log(
         self,
@@ -165,30 +228,35 @@ class RealTimeEvaluator:
         Returns:
             EvaluationResult with scores and pass/fail status.
         """
-        if not DEEPEVAL_AVAILABLE:
-            return EvaluationResult(
-                query=query,
-                response=response,
-                expert_id=expert_id,
-                evaluation_error="DeepEval not installed"
-            )
-        
+        # Cheapest check first: skipped samples allocate nothing
         if not self.should_evaluate():
             logger.debug(f"Skipping evaluation for query (sample_rate={self.sample_rate})")
+            return _SKIPPED_SENTINEL
+
+        return await self._evaluate_and_log(query, response, context, expert_id, trace_id)
+
+    async def _evaluate_and_log(
+        self,
+        query: str,
+        response: str,
+        context: list[str],
+        expert_id: str,
+        trace_id: Optional[str] = None,
+    ) -> EvaluationResult:
+        """Evaluate an already-sampled response and log results to Opik."""
+        if not DEEPEVAL_AVAILABLE:
             return EvaluationResult(
                 query=query,
                 response=response,
                 expert_id=expert_id,
-                evaluation_error="Skipped due to sampling"
+                evaluation_error="DeepEval not installed"
             )
         
         logger.info(f"Running real-time evaluation for expert: {expert_id}")
         
         try:
-            # Run evaluation in thread pool to avoid blocking
-            result = await asyncio.get_event_loop().run_in_executor(
-                None,
-                self._run_evaluation,
+            # Metrics run concurrently in worker threads to avoid blocking
+            result = await self._run_evaluation_async(
                 query,
                 response,
                 context,
@@ -216,7 +284,7 @@ class RealTimeEvaluator:
                 evaluation_error=str(e)
             )
     
-    def _run_evaluation(
+    async def _run_evaluation_async(
         self,
         query: str,
         response: str,
@@ -224,98 +292,98 @@ class RealTimeEvaluator:
         expert_id: str,
     ) -> EvaluationResult:
         """
-        Run DeepEval metrics synchronously (called from thread pool).
+        Run the enabled DeepEval metrics concurrently, one thread per metric.
+
+        Each metric makes its own LLM call, so latency is roughly that of the
+        slowest metric rather than the sum. Metric objects hold per-measurement
+        state, so each evaluation checks out its own set from the pool and
+        returns it when done. The pool grows only to the number of concurrent
+        evaluations.
         """
+        try:
+            metrics = self._metric_pool.get_nowait()
+        except queue.Empty:
+            metrics = {}
+        try:
+            return await self._measure(metrics, query, response, context, expert_id)
+        finally:
+            self._metric_pool.put(metrics)
+
+    @staticmethod
+    def _metric(metrics: dict, name: str):
+        """Return the pooled metric instance, constructing it on first use."""
+        if name not in metrics:
+            metrics[name] = _METRIC_FACTORIES[name]()
+        return metrics[name]
+
+    def _score(self, metrics: dict, name: str, test_case) -> float:
+        """Measure one metric synchronously (called from a worker thread)."""
+        metric = self._metric(metrics, name)
+        metric.measure(test_case)
+        return metric.score
+
+    async def _measure(
+        self,
+        metrics: dict,
+        query: str,
+        response: str,
+        context: list[str],
+        expert_id: str,
+    ) -> EvaluationResult:
         result = EvaluationResult(
             query=query,
             response=response,
             expert_id=expert_id,
         )
+        retrieval_context = context if context else ["No context available"]
 
         # Create test case
         test_case = LLMTestCase(
             input=query,
             actual_output=response,
-            retrieval_context=context if context else ["No context available"],
+            retrieval_context=retrieval_context,
         )
 
-        # Run faithfulness metric
+        # (metric, test case, result field, score if the metric fails)
+        jobs = []
         if self.enable_faithfulness:
-            try:
-                metric = FaithfulnessMetric(threshold=0.6)
-                metric.measure(test_case)
-                result.faithfulness_score = metric.score
-            except Exception as e:
-                logger.warning(f"Faithfulness metric failed: {e}")
-                result.faithfulness_score = 0.0
-
-        # Run relevancy metric
+            jobs.append(("faithfulness", test_case, "faithfulness_score", 0.0))
         if self.enable_relevancy:
-            try:
-                metric = AnswerRelevancyMetric(threshold=0.6)
-                metric.measure(test_case)
-                result.relevancy_score = metric.score
-            except Exception as e:
-                logger.warning(f"Relevancy metric failed: {e}")
-                result.relevancy_score = 0.0
-
-        # Run hallucination metric
+            jobs.append(("relevancy", test_case, "relevancy_score", 0.0))
         if self.enable_hallucination:
-            try:
-                # HallucinationMetric requires 'context' not 'retrieval_context'
-                hallucination_case = LLMTestCase(
-                    input=query,
-                    actual_output=response,
-                    context=context if context else ["No context available"],
-                )
-                metric = HallucinationMetric(threshold=0.6)
-                metric.measure(hallucination_case)
-                result.hallucination_score = metric.score
-            except Exception as e:
-                logger.warning(f"Hallucination metric failed: {e}")
-                result.hallucination_score = 1.0  # Assume worst case
+            # HallucinationMetric requires 'context' not 'retrieval_context'
+            hallucination_case = LLMTestCase(
+                input=query,
+                actual_output=response,
+                context=retrieval_context,
+            )
+            # Assume worst case on failure
+            jobs.append(("hallucination", hallucination_case, "hallucination_score", 1.0))
 
         # Run legal-specific metrics if available
         if LEGAL_METRICS_AVAILABLE:
-            try:
-                # Create expected output for legal accuracy comparison
-                # For now, we'll use a placeholder - in a real system this would come from ground truth
-                legal_test_case = LLMTestCase(
-                    input=query,
-                    actual_output=response,
-                    expected_output="The legal response should cite relevant articles, sections, and precedents",  # Placeholder
-                    retrieval_context=context if context else ["No context available"],
-                )
-
-                # Run legal accuracy metric
-                try:
-                    legal_accuracy_metric = LegalAccuracyMetric(threshold=0.7)
-                    legal_accuracy_metric.measure(legal_test_case)
-                    result.legal_accuracy_score = legal_accuracy_metric.score
-                except Exception as e:
-                    logger.warning(f"Legal accuracy metric failed: {e}")
-                    result.legal_accuracy_score = 0.0
-
-                # Run legal relevance metric
-                try:
-                    legal_relevance_metric = LegalRelevanceMetric(threshold=0.6)
-                    legal_relevance_metric.measure(test_case)  # Use the original test case
-                    result.legal_relevance_score = legal_relevance_metric.score
-                except Exception as e:
-                    logger.warning(f"Legal relevance metric failed: {e}")
-                    result.legal_relevance_score = 0.0
-
-                # Run legal authority metric
-                try:
-                    legal_authority_metric = LegalAuthorityMetric(threshold=0.5)
-                    legal_authority_metric.measure(test_case)  # Use the original test case
-                    result.legal_authority_score = legal_authority_metric.score
-                except Exception as e:
-                    logger.warning(f"Legal authority metric failed: {e}")
-                    result.legal_authority_score = 0.0
-
-            except Exception as e:
-                logger.warning(f"Legal metrics evaluation failed: {e}")
+            # Create expected output for legal accuracy comparison
+            # For now, we'll use a placeholder - in a real system this would come from ground truth
+            legal_test_case = LLMTestCase(
+                input=query,
+                actual_output=response,
+                expected_output="The legal response should cite relevant articles, sections, and precedents",  # Placeholder
+                retrieval_context=retrieval_context,
+            )
+            jobs.append(("legal_accuracy", legal_test_case, "legal_accuracy_score", 0.0))
+            # Relevance and authority use the original test case
+            jobs.append(("legal_relevance", test_case, "legal_relevance_score", 0.0))
+            jobs.append(("legal_authority", test_case, "legal_authority_score", 0.0))
+
+        scores = await asyncio.gather(
+            *(asyncio.to_thread(self._score, metrics, name, case) for name, case, _, _ in jobs),
+            return_exceptions=True,
+        )
+        for (name, _, field, fallback), score in zip(jobs, scores):
+            if isinstance(score, Exception):
+                logger.warning(f"{name} metric failed: {score}")
+                score = fallback
+            setattr(result, field, score)
 
         return result
     
@@ -328,10 +396,9 @@ class RealTimeEvaluator:
         Log evaluation results to Opik.
         """
         try:
-            import opik
-            
-            # Ensure project is set (reload settings if needed)
-            client = opik.Opik()
+            from ghana_legal.infrastructure.opik_utils import get_opik_client
+
+            client = get_opik_client()
             
             # Log metrics as feedback scores
             scores = []
@@ -354,36 +421,33 @@ class RealTimeEvaluator:
                     "reason": "DeepEval Metric"
                 })
             
-            if trace_id:
-                # Link to existing trace
-                for score in scores:
-                    client.log_feedback_score(
-                        trace_id=trace_id,
-                        name=score["name"],
-                        value=score["value"],
-                        reason=score["reason"]
+            def _upload() -> str:
+                target_id = trace_id
+                if not target_id:
+                    # Create standalone trace
+                    trace = client.trace(
+                        name=f"evaluation_{result.expert_id}",
+                        input={"query": result.query},
+                        output={"response": result.response},
+                        metadata=result.to_dict(),
+                        tags=["evaluation", "real-time"]
+                    )
+                    target_id = trace.id
+
+                # One bulk request for all scores instead of one per score
+                if scores:
+                    client.log_traces_feedback_scores(
+                        [{"id": target_id, **score} for score in scores]
                     )
+                return target_id
+
+            # The Opik client is synchronous; keep it off the event loop
+            target_id = await asyncio.to_thread(_upload)
+            if trace_id:
                 logger.info(f"Logged {len(scores)} scores to existing Opik trace {trace_id}")
             else:
-                # Create standalone trace
-                trace = client.trace(
-                    name=f"evaluation_{result.expert_id}",
-                    input={"query": result.query},
-                    output={"response": result.response},
-                    metadata=result.to_dict(),
-                    tags=["evaluation", "real-time"]
-                )
-                
-                # Log feedback to this new trace
-                for score in scores:
-                    trace.log_feedback_score(
-                        name=score["name"],
-                        value=score["value"],
-                        reason=score["reason"]
-                    )
-                
-                logger.info(f"Created Opik trace: {trace.id} with scores: {scores}")
-                
+                logger.info(f"Created Opik trace: {target_id} with scores: {scores}")
+
         except Exception as e:
             logger.error(f"Failed to log to Opik: {e}")
 
@@ -400,3 +464,85 @@ def get_evaluator() -> RealTimeEvaluator:
             sample_rate=getattr(settings, 'EVAL_SAMPLE_RATE', 1.0),
         )
     return _evaluator
+
+
+# Background evaluation queue
+EVAL_QUEUE_MAXSIZE = 1024
+EVAL_CONCURRENCY = 4
+
+# One queue and worker set per event loop. asyncio queues and tasks belong to
+# the loop that created them, and the evaluation harness runs each sample on
+# its own loop, so nothing here may be shared across loops.
+_eval_queues: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_eval_workers: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+async def _eval_worker(eval_queue: asyncio.Queue) -> None:
+    """Drain queued evaluations until cancelled."""
+    evaluator = get_evaluator()
+    while True:
+        item = await eval_queue.get()
+        try:
+            # Sampling already happened in enqueue_evaluation
+            await evaluator._evaluate_and_log(**item)
+        except Exception as e:
+            logger.error(f"Background evaluation failed: {e}")
+        finally:
+            eval_queue.task_done()
+
+
+def start_eval_workers(num_workers: int = EVAL_CONCURRENCY) -> None:
+    """Create the evaluation queue and its workers on the running event loop.
+
+    The number of workers bounds how many evaluations run concurrently.
+    """
+    loop = asyncio.get_running_loop()
+    if _eval_workers.get(loop):
+        return
+    eval_queue = asyncio.Queue(maxsize=EVAL_QUEUE_MAXSIZE)
+    _eval_queues[loop] = eval_queue
+    _eval_workers[loop] = [
+        asyncio.create_task(_eval_worker(eval_queue)) for _ in range(num_workers)
+    ]
+    logger.info(f"Started {num_workers} background evaluation workers")
+
+
+async def stop_eval_workers(drain: bool = False) -> None:
+    """Cancel the running loop's evaluation workers.
+
+    Args:
+        drain: Wait for queued evaluations to finish first. Otherwise anything
+            still queued is dropped.
+    """
+    loop = asyncio.get_running_loop()
+    eval_queue = _eval_queues.pop(loop, None)
+    workers = _eval_workers.pop(loop, [])
+    if drain and eval_queue is not None and workers:
+        await eval_queue.join()
+    for worker in workers:
+        worker.cancel()
+    await asyncio.gather(*workers, return_exceptions=True)
+
+
+def enqueue_evaluation(**item) -> bool:
+    """Queue an evaluation without blocking the caller.
+
+    Workers are started lazily on the running loop when the API lifespan has
+    not done so (e.g. CLI tools, the evaluation harness). Callers that own such
+    a loop should ``await stop_eval_workers(drain=True)`` before it ends.
+
+    Returns:
+        False if the query was sampled out or the queue is full.
+    """
+    # Sample before queueing so skipped queries never occupy a slot
+    if not get_evaluator().should_evaluate():
+        return False
+    loop = asyncio.get_running_loop()
+    if loop not in _eval_workers:
+        start_eval_workers()
+    try:
+        _eval_queues[loop].put_nowait(item)
+    except asyncio.QueueFull:
+        logger.warning("Evaluation queue full, dropping evaluation")
+        return False
+    return True
@@ -1,57 +1,98 @@
-import time
-
+import asyncio
+import itertools
+import os
+from contextlib import aclosing
+from typing import Iterator
+
+import tiktoken
+from langchain_core.documents import Document
 from langchain_core.prompts import (
     ChatPromptTemplate,
 )
+from langchain_core.rate_limiters import InMemoryRateLimiter
 from langchain_groq import ChatGroq
-from langchain_text_splitters import RecursiveCharacterTextSplitter
 from loguru import logger
 
-from ghana_legal.application.data.extract import get_extraction_generator
+from ghana_legal.application.data.extract import aget_extraction_generator
 from ghana_legal.config import settings
 from ghana_legal.domain import prompts
 from ghana_legal.domain.evaluation import EvaluationDataset, EvaluationDatasetSample
 from ghana_legal.domain.legal_expert import LegalExpertExtract
 
 
+def _iter_token_chunks(
+    encoding: tiktoken.Encoding, docs: list[Document], chunk_size: int
+) -> Iterator[Document]:
+    """Lazily split documents into consecutive, non-overlapping windows of ``chunk_size`` tokens.
+
+    Documents are tokenised a few at a time with ``encode_batch``, which runs on
+    tiktoken's native thread pool outside the GIL, so only the documents the
+    caller actually consumes are ever encoded.
+    """
+    batch_size = os.cpu_count() or 1
+    for offset in range(0, len(docs), batch_size):
+        batch = docs[offset : offset + batch_size]
+        token_lists = encoding.encode_batch(
+            [doc.page_content for doc in batch],
+            num_threads=batch_size,
+            disallowed_special=(),
+        )
+        for doc, tokens in zip(batch, token_lists):
+            for start in range(0, len(tokens), chunk_size):
+                yield Document(
+                    page_content=encoding.decode(tokens[start : start + chunk_size]),
+                    metadata=dict(doc.metadata),
+                )
+
+
 class EvaluationDatasetGenerator:
-    def __init__(self, temperature: float = 0.8, max_samples: int = 40) -> None:
+    def __init__(
+        self, temperature: float = 0.8, max_samples: int = 40, max_concurrency: int = 4
+    ) -> None:
         self.temperature = temperature
         self.max_samples = max_samples
+        self.max_concurrency = max_concurrency
 
         self.__chain = self.__build_chain()
-        self.__splitter = self.__build_splitter()
+        self.__encoding = tiktoken.get_encoding("cl100k_base")
+        self.__chunk_size = self.__build_chunk_size()
 
     def __call__(self, experts: list[LegalExpertExtract]) -> EvaluationDataset:
-        dataset_samples = []
-        extraction_generator = get_extraction_generator(experts)
-        for expert, docs in extraction_generator:
-            chunks = self.__splitter.split_documents(docs)
-            for chunk in chunks[:4]:
-                try:
-                    dataset_sample: EvaluationDatasetSample = self.__chain.invoke(
-                        {"expert": expert, "document": chunk.page_content}
-                    )
-                except Exception as e:
-                    logger.error(f"Error generating dataset sample: {e}")
-                    continue
+        return asyncio.run(self.agenerate(experts))
 
-                dataset_sample.expert_id = expert.id
+    async def agenerate(self, experts: list[LegalExpertExtract]) -> EvaluationDataset:
+        dataset_samples = []
+        async with aclosing(aget_extraction_generator(experts)) as extraction_generator:
+            async for expert, docs in extraction_generator:
+                remaining = self.max_samples - len(dataset_samples)
+                chunks = _iter_token_chunks(self.__encoding, docs, self.__chunk_size)
+                inputs = [
+                    {"expert": expert, "document": chunk.page_content}
+                    for chunk in itertools.islice(chunks, min(4, remaining))
+                ]
+                # Chunks are sent concurrently, paced by the model's token-bucket
+                # limiter; the Groq client's retries cover any 429s left over.
+                results = await self.__chain.abatch(
+                    inputs,
+                    config={"max_concurrency": self.max_concurrency},
+                    return_exceptions=True,
+                )
+                for dataset_sample in results:
+                    if isinstance(dataset_sample, Exception):
+                        logger.error(f"Error generating dataset sample: {dataset_sample}")
+                        continue
 
-                if self.__validate_sample(dataset_sample):
-                    dataset_samples.append(dataset_sample)
+                    dataset_sample.expert_id = expert.id
 
-                time.sleep(1)  # To avoid rate limiting
+                    if self.__validate_sample(dataset_sample):
+                        dataset_samples.append(dataset_sample)
 
                 if len(dataset_samples) >= self.max_samples:
-                    break
-
-            if len(dataset_samples) >= self.max_samples:
-                logger.warning(
-                    f"Reached maximum number of samples ({self.max_samples}). Stopping."
-                )
+                    logger.warning(
+                        f"Reached maximum number of samples ({self.max_samples}). Stopping."
+                    )
 
-                break
+                    break
 
         assert len(dataset_samples) >= 0, "Could not generate any evaluation samples."
 
@@ -68,6 +109,11 @@ class EvaluationDatasetGenerator:
             api_key=settings.GROQ_API_KEY,
             model_name=settings.GROQ_LLM_MODEL,
             temperature=self.temperature,
+            max_retries=5,
+            rate_limiter=InMemoryRateLimiter(
+                requests_per_second=settings.GROQ_REQUESTS_PER_SECOND,
+                max_bucket_size=self.max_concurrency,
+            ),
         )
         model = model.with_structured_output(EvaluationDatasetSample)
 
@@ -80,14 +126,8 @@ class EvaluationDatasetGenerator:
 
         return prompt | model
 
-    def __build_splitter(
-        self, max_token_limit: int = 6000
-    ) -> RecursiveCharacterTextSplitter:
-        return RecursiveCharacterTextSplitter.from_tiktoken_encoder(
-            encoding_name="cl100k_base",
-            chunk_size=int(max_token_limit * 0.25),
-            chunk_overlap=0,
-        )
+    def __build_chunk_size(self, max_token_limit: int = 6000) -> int:
+        return int(max_token_limit * 0.25)
 
     def __validate_sample(self, sample: EvaluationDatasetSample) -> bool:
         return (
@@ -4,17 +4,23 @@ Provides document ingestion (LongTermMemoryCreator) and retrieval (LongTermMemor
 that work with any vector database backend via the Retriever protocol.
 """
 
+import asyncio
+from contextlib import aclosing
+
 from langchain_core.documents import Document
 from loguru import logger
 
-from ghana_legal.application.data import deduplicate_documents, get_extraction_generator
+from ghana_legal.application.data import aget_extraction_generator, deduplicate_documents
 from ghana_legal.application.rag.base_retriever import Retriever
 from ghana_legal.application.rag.retrievers import get_retriever
 from ghana_legal.application.rag.splitters import Splitter, get_splitter
 from ghana_legal.config import settings
-from ghana_legal.domain.legal_expert import LegalExpertExtract
+from ghana_legal.domain.legal_expert import LegalExpert, LegalExpertExtract
 from ghana_legal.application.rag.legal_parser import get_legal_parser, LegalDocument
 
+# Experts chunked/embedded/upserted at once
+INGEST_CONCURRENCY = 4
+
 
 class LongTermMemoryCreator:
     """Ingests legal documents into the vector store with metadata enrichment."""
@@ -36,52 +42,74 @@ class LongTermMemoryCreator:
         return cls(retriever, splitter)
 
     def __call__(self, experts: list[LegalExpertExtract]) -> None:
+        asyncio.run(self.acall(experts))
+
+    async def acall(
+        self, experts: list[LegalExpertExtract], max_concurrency: int = INGEST_CONCURRENCY
+    ) -> None:
+        """Ingest experts as their extraction finishes, several at a time.
+
+        Chunking, parsing and embedding run in worker threads, so extraction
+        of the remaining experts keeps going while earlier ones are ingested.
+        """
         if len(experts) == 0:
             logger.warning("No experts to extract. Exiting.")
             return
 
-        extraction_generator = get_extraction_generator(experts)
-        for expert_name, docs in extraction_generator:
-            chunked_docs = self.splitter.split_documents(docs)
-            chunked_docs = deduplicate_documents(chunked_docs, threshold=0.7)
-
-            # Prepare batch data for ingestion
-            texts = []
-            metadatas = []
-            ids = []
-
-            for i, doc in enumerate(chunked_docs):
-                # Parse document to extract legal structure
-                legal_doc = self.legal_parser.parse_document(
-                    doc.page_content, source=expert_name
-                )
-
-                # Build structured metadata
-                metadata = {
-                    **doc.metadata,
-                    "expert_type": expert_name,
-                    "title": legal_doc.title,
-                    "article": legal_doc.article,
-                    "section": legal_doc.section,
-                    "subsection": legal_doc.subsection,
-                    "court": legal_doc.court,
-                    "case_number": legal_doc.case_number,
-                    "date": legal_doc.date,
-                    "citations": legal_doc.citations,
-                    "jurisdiction": legal_doc.jurisdiction,
-                    "document_type": legal_doc.document_type,
-                }
-
-                texts.append(doc.page_content)
-                metadatas.append(metadata)
-                ids.append(f"{expert_name}_doc_{i}")
-
-            # Use the Retriever protocol's add_texts method (works for both ChromaDB and Qdrant)
-            if texts:
-                self.retriever.add_texts(texts=texts, metadatas=metadatas, ids=ids)
-                logger.info(
-                    f"Ingested {len(texts)} chunks for expert '{expert_name}'"
-                )
+        sem = asyncio.Semaphore(max_concurrency)
+
+        async def _ingest(expert: LegalExpert, docs: list[Document]) -> None:
+            async with sem:
+                await asyncio.to_thread(self.ingest_expert, expert, docs)
+
+        tasks = []
+        async with aclosing(aget_extraction_generator(experts)) as extraction_generator:
+            async for expert, docs in extraction_generator:
+                tasks.append(asyncio.create_task(_ingest(expert, docs)))
+        await asyncio.gather(*tasks)
+
+    def ingest_expert(self, expert_name: LegalExpert, docs: list[Document]) -> None:
+        """Chunk, enrich and upsert one expert's documents."""
+        chunked_docs = self.splitter.split_documents(docs)
+        chunked_docs = deduplicate_documents(chunked_docs, threshold=0.7)
+
+        # Prepare batch data for ingestion
+        texts = []
+        metadatas = []
+        ids = []
+
+        for i, doc in enumerate(chunked_docs):
+            # Parse document to extract legal structure
+            legal_doc = self.legal_parser.parse_document(
+                doc.page_content, source=expert_name
+            )
+
+            # Build structured metadata
+            metadata = {
+                **doc.metadata,
+                "expert_type": expert_name,
+                "title": legal_doc.title,
+                "article": legal_doc.article,
+                "section": legal_doc.section,
+                "subsection": legal_doc.subsection,
+                "court": legal_doc.court,
+                "case_number": legal_doc.case_number,
+                "date": legal_doc.date,
+                "citations": legal_doc.citations,
+                "jurisdiction": legal_doc.jurisdiction,
+                "document_type": legal_doc.document_type,
+            }
+
+            texts.append(doc.page_content)
+            metadatas.append(metadata)
+            ids.append(f"{expert_name}_doc_{i}")
+
+        # Use the Retriever protocol's add_texts method (works for both ChromaDB and Qdrant)
+        if texts:
+            self.retriever.add_texts(texts=texts, metadatas=metadatas, ids=ids)
+            logger.info(
+                f"Ingested {len(texts)} chunks for expert '{expert_name}'"
+            )
 
 
 class LongTermMemoryRetriever:
@@ -0,0 +1,101 @@
+"""Content-addressed Parquet cache for document embeddings.
+
+Chunks are keyed by the SHA-256 of their text, so Airflow retries and backfills
+only send never-seen chunks to the embedding API. Rows are stored as a Parquet
+dataset partitioned by ``model_name``.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+from loguru import logger
+
+from ghana_legal.config import settings
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+    logger.warning("pyarrow not installed. Embedding cache disabled.")
+
+
+def text_hash(text: str) -> str:
+    """Return the cache key for a chunk of text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """Parquet-backed lookup of ``hash -> vector`` for a single embedding model."""
+
+    def __init__(self, root: Path, model_name: str, dim: int) -> None:
+        self.root = root
+        self.model_name = model_name
+        self.dim = dim
+
+    def get_many(self, hashes: List[str]) -> Dict[str, np.ndarray]:
+        """Return cached vectors for whichever of ``hashes`` are present."""
+        if not hashes or not self.root.exists():
+            return {}
+
+        try:
+            dataset = ds.dataset(self.root, format="parquet", partitioning="hive")
+            table = dataset.to_table(
+                columns=["hash", "vector"],
+                filter=(ds.field("model_name") == self.model_name)
+                & (ds.field("dim") == self.dim)
+                & ds.field("hash").isin(hashes),
+            )
+        except Exception as e:
+            logger.warning(f"Failed to read embedding cache at {self.root}: {e}")
+            return {}
+
+        if table.num_rows == 0:
+            return {}
+
+        vectors = (
+            table.column("vector").combine_chunks().flatten().to_numpy()
+            .astype(np.float32, copy=False)
+            .reshape(-1, self.dim)
+        )
+        return dict(zip(table.column("hash").to_pylist(), vectors))
+
+    def put_many(self, hashes: List[str], vectors: np.ndarray) -> None:
+        """Append freshly computed vectors to the cache."""
+        if not hashes:
+            return
+
+        table = pa.table({
+            "hash": pa.array(hashes, type=pa.string()),
+            "vector": pa.FixedSizeListArray.from_arrays(
+                pa.array(np.ascontiguousarray(vectors, dtype=np.float32).ravel()),
+                self.dim,
+            ),
+            "model_name": pa.array([self.model_name] * len(hashes), type=pa.string()),
+            "dim": pa.array([self.dim] * len(hashes), type=pa.int32()),
+        })
+        try:
+            pq.write_to_dataset(table, root_path=self.root, partition_cols=["model_name"])
+        except Exception as e:
+            logger.warning(f"Failed to write embedding cache at {self.root}: {e}")
+
+
+def get_embedding_cache(model_name: str, dim: int) -> Optional[EmbeddingCache]:
+    """Build the embedding cache rooted at ``$PROJECT_ROOT/<EMBEDDINGS_CACHE_DIR>``.
+
+    Returns None when pyarrow is unavailable.
+    """
+    if not PYARROW_AVAILABLE:
+        return None
+
+    root = settings.EMBEDDINGS_CACHE_DIR
+    project_root = os.environ.get("PROJECT_ROOT")
+    if project_root and not root.is_absolute():
+        root = Path(project_root) / root
+
+    return EmbeddingCache(root=root, model_name=model_name, dim=dim)
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from langchain_voyageai import VoyageAIEmbeddings
 from ghana_legal.config import settings
 
@@ -20,10 +22,15 @@ def get_embedding_model(
     return get_voyageai_embedding_model(model_id)
 
 
+@lru_cache(maxsize=4)
 def get_voyageai_embedding_model(
     model_id: str
 ) -> VoyageAIEmbeddings:
-    """Gets a Voyage AI embedding model instance.
+    """Gets a Voyage AI embedding model instance, shared per model ID.
+
+    embed_documents packs texts into requests of up to
+    RAG_EMBEDDING_BATCH_SIZE texts, bounded by the model's per-request token
+    limit, so bulk ingests make as few API calls as the plan allows.
 
     Args:
         model_id (str): The ID/name of the Voyage AI embedding model to use
@@ -34,4 +41,5 @@ def get_voyageai_embedding_model(
     return VoyageAIEmbeddings(
         voyage_api_key=settings.VOYAGE_API_KEY,
         model=model_id,
+        batch_size=settings.RAG_EMBEDDING_BATCH_SIZE,
     )
@@ -4,26 +4,33 @@ Drop-in replacement for ChromaDB retriever, using Qdrant Cloud for production ve
 """
 
 import os
-from typing import List, Optional
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
 
+import numpy as np
 from langchain_core.documents import Document
 from loguru import logger
 from sentence_transformers import CrossEncoder
 from qdrant_client import QdrantClient
 from qdrant_client.http.models import (
     Distance,
-    PointStruct,
+    HnswConfigDiff,
     VectorParams,
     Filter,
     FieldCondition,
     MatchValue,
 )
 
+from ghana_legal.application.rag.embedding_cache import get_embedding_cache, text_hash
 from ghana_legal.config import settings
 
 # Global singleton instance
 _qdrant_retriever_instance = None
 
+# Texts per embedding request / points per upload request during ingestion
+EMBED_BATCH_SIZE = 128
+UPLOAD_BATCH_SIZE = 256
+
 
 class LegalQdrantRetriever:
     """Legal-specific retriever using Qdrant Cloud with hybrid search and reranking."""
@@ -58,6 +65,7 @@ class LegalQdrantRetriever:
             logger.info(f"Loading Voyage AI embedding model: {embedding_model_id}...")
             self.embedding_model = get_embedding_model(embedding_model_id)
             self.embedding_dim = settings.RAG_TEXT_EMBEDDING_MODEL_DIM  # 1024 for voyage-law-2
+            self.embedding_cache = get_embedding_cache(embedding_model_id, self.embedding_dim)
             logger.info("Voyage AI embedding model loaded successfully")
 
             # Ensure collection exists
@@ -107,30 +115,66 @@ class LegalQdrantRetriever:
         if ids is None:
             ids = [f"doc_{i}" for i in range(len(texts))]
 
-        # Generate embeddings
-        embeddings = self.embedding_model.embed_documents(texts)
-
-        points = []
-        for i, (text, embedding) in enumerate(zip(texts, embeddings)):
+        # Collect every vector into one contiguous (n, dim) float32 matrix
+        # for the bulk upload, reusing cached embeddings where possible.
+        vectors = np.empty((len(texts), self.embedding_dim), dtype=np.float32)
+        hashes = [text_hash(text) for text in texts]
+        cached = self.embedding_cache.get_many(hashes) if self.embedding_cache else {}
+        for i, h in enumerate(hashes):
+            if h in cached:
+                vectors[i] = cached[h]
+
+        # One embedding API call per batch of cache misses
+        misses = [i for i, h in enumerate(hashes) if h not in cached]
+        for start in range(0, len(misses), EMBED_BATCH_SIZE):
+            batch = misses[start : start + EMBED_BATCH_SIZE]
+            vectors[batch] = self.embedding_model.embed_documents([texts[i] for i in batch])
+
+        if misses and self.embedding_cache:
+            self.embedding_cache.put_many([hashes[i] for i in misses], vectors[misses])
+        logger.info(f"Embedding cache: {len(texts) - len(misses)} hits, {len(misses)} misses")
+
+        payloads = []
+        for i, text in enumerate(texts):
             payload = {"page_content": text}
             if metadatas and i < len(metadatas):
                 payload.update(metadatas[i])
+            payloads.append(payload)
 
-            points.append(
-                PointStruct(
-                    id=abs(hash(ids[i])) % (2**63),  # Qdrant needs int IDs
-                    vector=embedding,
-                    payload=payload,
-                )
-            )
+        self.client.upload_collection(
+            collection_name=self.collection_name,
+            vectors=vectors,
+            payload=payloads,
+            ids=[abs(hash(doc_id)) % (2**63) for doc_id in ids],  # Qdrant needs int IDs
+            batch_size=UPLOAD_BATCH_SIZE,
+            wait=True,
+        )
+
+        logger.info(f"Added {len(texts)} documents to Qdrant collection '{self.collection_name}'")
 
-        # Batch upsert
-        batch_size = 100
-        for i in range(0, len(points), batch_size):
-            batch = points[i : i + batch_size]
-            self.client.upsert(collection_name=self.collection_name, points=batch)
+    @contextmanager
+    def bulk_ingest(self) -> Iterator[None]:
+        """Suspend HNSW graph maintenance while bulk-loading points.
 
-        logger.info(f"Added {len(points)} documents to Qdrant collection '{self.collection_name}'")
+        Sets ``m=0`` so upserts skip incremental index updates, then restores
+        the collection's original ``m`` so the graph is rebuilt once at the end.
+        """
+        info = self.client.get_collection(self.collection_name)
+        original_m = info.config.hnsw_config.m or 16
+
+        logger.info(f"Disabling HNSW indexing on '{self.collection_name}' for bulk ingest")
+        self.client.update_collection(
+            collection_name=self.collection_name,
+            hnsw_config=HnswConfigDiff(m=0),
+        )
+        try:
+            yield
+        finally:
+            self.client.update_collection(
+                collection_name=self.collection_name,
+                hnsw_config=HnswConfigDiff(m=original_m),
+            )
+            logger.info(f"Restored HNSW m={original_m} on '{self.collection_name}'")
 
     def _vector_search(self, query: str, k: int) -> List[Document]:
         """Perform vector similarity search."""
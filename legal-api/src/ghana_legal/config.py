@@ -13,6 +13,8 @@ class Settings(BaseSettings):
     GROQ_API_KEY: str
     GROQ_LLM_MODEL: str = "llama-3.3-70b-versatile"
     GROQ_LLM_MODEL_CONTEXT_SUMMARY: str = "llama-3.1-8b-instant"
+    # Client-side request budget for batch jobs (dataset generation); 0.5 = 30 RPM
+    GROQ_REQUESTS_PER_SECOND: float = 0.5
     
     # --- OpenAI Configuration (Required for evaluation) ---
     OPENAI_API_KEY: str
@@ -62,6 +64,8 @@ class Settings(BaseSettings):
     RAG_TOP_K: int = 3
     RAG_DEVICE: str = "cpu"
     RAG_CHUNK_SIZE: int = 256
+    # Texts per Voyage embed call; the client also caps each call at the model's token limit
+    RAG_EMBEDDING_BATCH_SIZE: int = 1000
     VOYAGE_API_KEY: str = Field(default="", description="API Key for Voyage AI")
 
     # --- Vector Database Configuration ---
@@ -110,6 +114,11 @@ class Settings(BaseSettings):
     # --- Paths Configuration ---
     EVALUATION_DATASET_FILE_PATH: Path = Path("data/evaluation_dataset.json")
     EXTRACTION_METADATA_FILE_PATH: Path = Path("data/legal_experts.json")
+    EMBEDDINGS_CACHE_DIR: Path = Path("data/embeddings_cache")
+    WIKIPEDIA_CACHE_DIR: Path = Path("data/wikipedia_cache")
+    WIKIPEDIA_CACHE_TTL_DAYS: int = 7
+    LEGAL_DOCS_CACHE_DIR: Path = Path("data/legal_docs_cache")
+    LEGAL_CACHE_DISABLE: bool = False
 
 
 settings = Settings()
@@ -1,8 +1,7 @@
-import json
 from pathlib import Path
 from typing import List
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 class LegalExpertExtract(BaseModel):
@@ -23,10 +22,11 @@ class LegalExpertExtract(BaseModel):
 
     @classmethod
     def from_json(cls, metadata_file: Path) -> list["LegalExpertExtract"]:
-        with open(metadata_file, "r") as f:
-            experts_data = json.load(f)
+        # Parse and validate in one pass, without an intermediate list of dicts
+        return _EXPERT_EXTRACTS_ADAPTER.validate_json(Path(metadata_file).read_bytes())
 
-        return [cls(**expert) for expert in experts_data]
+
+_EXPERT_EXTRACTS_ADAPTER = TypeAdapter(list[LegalExpertExtract])
 
 
 class LegalExpert(BaseModel):
@@ -39,6 +39,9 @@ class LegalExpert(BaseModel):
         style (str): Description of the expert's communication style.
     """
 
+    # Instances are cached and shared by LegalExpertFactory.
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(description="Unique identifier for the legal expert")
     name: str = Field(description="Name of the legal expert")
     expertise: str = Field(
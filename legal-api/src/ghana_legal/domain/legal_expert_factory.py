@@ -1,3 +1,5 @@
+from types import MappingProxyType
+
 from ghana_legal.domain.exceptions import (
     LegalExpertNameNotFound,
     LegalExpertPerspectiveNotFound,
@@ -5,19 +7,20 @@ from ghana_legal.domain.exceptions import (
 )
 from ghana_legal.domain.legal_expert import LegalExpert
 
-EXPERT_NAMES = {
+# Read-only views, so callers cannot mutate the tables behind the factory's back
+EXPERT_NAMES = MappingProxyType({
     "constitutional": "Constitutional Expert",
     "case_law": "Case Law Analyst",
     "legal_historian": "Legal Historian",
-}
+})
 
-EXPERT_STYLES = {
+EXPERT_STYLES = MappingProxyType({
     "constitutional": "The Constitutional Expert speaks with the authoritative yet accessible tone of a seasoned legal scholar. They cite specific articles of the 1992 Constitution to back up their points, ensuring accuracy while explaining concepts clearly to laypeople. Their style is formal, precise, and educational.",
     "case_law": "The Case Law Analyst communicates with the sharp, analytical precision of a barrister. They focus on precedent, citing landmark Supreme Court and Court of Appeal rulings to explain how the law is applied in practice. Their style is logical, argumentative, and detailed.",
     "legal_historian": "The Legal Historian weaves narratives of Ghana's legal evolution, connecting current laws to their colonial and post-independence roots. They provide context and background, making the law feel like a living story. Their style is narrative, contextual, and engaging.",
-}
+})
 
-EXPERT_EXPERTISE = {
+EXPERT_EXPERTISE = MappingProxyType({
     "constitutional": """Specialist in the 1992 Constitution of Ghana and its amendments. 
 This expert focuses on fundamental human rights, powers of government branches, and constitutional 
 interpretation. They prioritize the supreme law of the land above all else.""",
@@ -27,48 +30,64 @@ focusing on the doctrine of stare decisis and landmark rulings like Tuffuor v At
     "legal_historian": """Specialist in the history and evolution of the Ghanaian legal system.
 This expert understands the transition from customary law and British common law to the modern
 constitutional era, creating a bridge between the past and present legal landscape.""",
-}
+})
+
+
+def _build_experts() -> MappingProxyType[str, LegalExpert]:
+    """Validate the expert tables once and build every expert up front."""
+    # Every table must cover the same IDs, or an expert would be listed but
+    # fail to build (or vice versa)
+    for expert_id in EXPERT_EXPERTISE.keys() | EXPERT_STYLES.keys():
+        if expert_id not in EXPERT_NAMES:
+            raise LegalExpertNameNotFound(expert_id)
+
+    experts = {}
+    for expert_id in EXPERT_NAMES:
+        if expert_id not in EXPERT_EXPERTISE:
+            raise LegalExpertPerspectiveNotFound(expert_id)
+
+        if expert_id not in EXPERT_STYLES:
+            raise LegalExpertStyleNotFound(expert_id)
+
+        experts[expert_id] = LegalExpert(
+            id=expert_id,
+            name=EXPERT_NAMES[expert_id],
+            expertise=EXPERT_EXPERTISE[expert_id],
+            style=EXPERT_STYLES[expert_id],
+        )
+    return MappingProxyType(experts)
 
-AVAILABLE_EXPERTS = list(EXPERT_STYLES.keys())
+
+# Experts are immutable, so every request for the same ID shares one instance
+_EXPERTS = _build_experts()
+AVAILABLE_EXPERTS = tuple(_EXPERTS)
 
 
 class LegalExpertFactory:
     @staticmethod
     def get_legal_expert(id: str) -> LegalExpert:
-        """Creates a legal expert instance based on the provided ID.
+        """Returns the legal expert instance for the provided ID.
 
         Args:
-            id (str): Identifier of the legal expert to create
+            id (str): Identifier of the legal expert
 
         Returns:
             LegalExpert: Instance of the legal expert
 
         Raises:
-            ValueError: If expert ID is not found in configurations
+            LegalExpertNameNotFound: If expert ID is not found in configurations
         """
         id_lower = id.lower()
-
-        if id_lower not in EXPERT_NAMES:
-            raise LegalExpertNameNotFound(id_lower)
-
-        if id_lower not in EXPERT_EXPERTISE:
-            raise LegalExpertPerspectiveNotFound(id_lower)
-
-        if id_lower not in EXPERT_STYLES:
-            raise LegalExpertStyleNotFound(id_lower)
-
-        return LegalExpert(
-            id=id_lower,
-            name=EXPERT_NAMES[id_lower],
-            expertise=EXPERT_EXPERTISE[id_lower],
-            style=EXPERT_STYLES[id_lower],
-        )
+        try:
+            return _EXPERTS[id_lower]
+        except KeyError:
+            raise LegalExpertNameNotFound(id_lower) from None
 
     @staticmethod
-    def get_available_experts() -> list[str]:
-        """Returns a list of all available legal expert IDs.
+    def get_available_experts() -> tuple[str, ...]:
+        """Returns all available legal expert IDs.
 
         Returns:
-            list[str]: List of expert IDs that can be instantiated
+            tuple[str, ...]: Expert IDs that can be instantiated
         """
         return AVAILABLE_EXPERTS
@@ -1,6 +1,13 @@
 import opik
+from jinja2 import StrictUndefined
+from jinja2.sandbox import SandboxedEnvironment
 from loguru import logger
 
+# Same sandbox LangChain's jinja2 formatter uses, but shared and reused.
+# StrictUndefined keeps a missing prompt variable an error, as it was with
+# ChatPromptTemplate's input validation, instead of rendering it as "".
+_JINJA_ENV = SandboxedEnvironment(undefined=StrictUndefined)
+
 
 class Prompt:
     def __init__(self, name: str, prompt: str) -> None:
@@ -15,6 +22,13 @@ class Prompt:
 
             self.__prompt = prompt
 
+        # Compile once; rendering no longer re-lexes/parses the template
+        self._template = _JINJA_ENV.from_string(self.prompt)
+
+    def render(self, **kwargs) -> str:
+        """Render the precompiled jinja2 template."""
+        return self._template.render(**kwargs)
+
     @property
     def prompt(self) -> str:
         if isinstance(self.__prompt, opik.Prompt):
@@ -1,20 +1,32 @@
+import asyncio
 import os
 from contextlib import asynccontextmanager
 from typing import Optional
 
+import orjson
 import sentry_sdk
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect, Depends
+from fastapi import FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect, Depends
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from opik.integrations.langchain import OpikTracer
-from pydantic import BaseModel
+from loguru import logger
+from pydantic import BaseModel, ValidationError
 
 from ghana_legal.application.conversation_service.generate_response import (
+    close_checkpointer,
     get_response,
     get_streaming_response,
 )
+from ghana_legal.application.conversation_service.workflow.chains import (
+    close_http_client,
+)
 from ghana_legal.application.conversation_service.reset_conversation import (
     reset_conversation_state,
 )
+from ghana_legal.application.evaluation.evaluation_service import (
+    get_evaluator,
+    start_eval_workers,
+    stop_eval_workers,
+)
 from ghana_legal.infrastructure.auth import get_optional_user, get_current_user
 from ghana_legal.infrastructure.database import init_db, close_db, seed_pipeline_cases
 from ghana_legal.infrastructure.usage import check_quota
@@ -28,6 +40,22 @@ from .opik_utils import configure
 
 configure()
 
+# One tracer for the process, created on first flush
+_tracer = None
+
+
+def _flush_tracer() -> None:
+    global _tracer
+    if _tracer is None:
+        try:
+            from opik.integrations.langchain import OpikTracer
+
+            _tracer = OpikTracer()
+        except Exception as e:
+            logger.warning(f"Couldn't create the Opik tracer, traces won't be flushed: {e}")
+            return
+    _tracer.flush()
+
 # Initialize Sentry for error tracking & performance monitoring
 sentry_dsn = os.getenv("SENTRY_DSN")
 if sentry_dsn:
@@ -69,11 +97,18 @@ async def lifespan(app: FastAPI):
         from loguru import logger
         logger.error(f"Failed to initialize PostgreSQL: {e}")
 
+    # Drain real-time evaluations off the request path
+    await asyncio.to_thread(get_evaluator().warmup)
+    start_eval_workers()
+
     yield
 
     # Shutdown code
-    opik_tracer = OpikTracer()
-    opik_tracer.flush()
+    # Let evaluations queued by the last requests finish before exiting
+    await stop_eval_workers(drain=True)
+    _flush_tracer()
+    await close_checkpointer()
+    await close_http_client()
     await close_db()
 
 
@@ -96,6 +131,12 @@ app.add_middleware(
 )
 
 
+@app.get("/healthz", tags=["health"])
+async def healthz():
+    """Liveness probe: answers without touching the database, retriever or LLMs."""
+    return {"status": "ok"}
+
+
 @app.get("/api/usage", tags=["billing"])
 async def get_usage_quota(user: dict = Depends(get_current_user)):
     """Get the current user's usage quota and plan tier."""
@@ -156,8 +197,26 @@ class ChatMessage(BaseModel):
     expert_id: str
 
 
-@app.post("/chat")
-async def chat(chat_message: ChatMessage):
+@app.post(
+    "/chat",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": ChatMessage.model_json_schema()}},
+        }
+    },
+)
+async def chat(request: Request):
+    # Validate the raw body in one pass (pydantic-core's JSON parser) instead
+    # of letting FastAPI json.loads it first and then validate the dict
+    try:
+        chat_message = ChatMessage.model_validate_json(await request.body())
+    except ValidationError as e:
+        # Match FastAPI's own body errors, whose loc starts with "body"
+        raise RequestValidationError(
+            [{**err, "loc": ("body", *err["loc"])} for err in e.errors(include_url=False)]
+        ) from e
+
     try:
         # Check cache first
         cache = get_cache()
@@ -165,8 +224,7 @@ async def chat(chat_message: ChatMessage):
         if cached_response:
             return {"response": cached_response}
 
-        expert_factory = LegalExpertFactory()
-        expert = expert_factory.get_legal_expert(chat_message.expert_id)
+        expert = LegalExpertFactory.get_legal_expert(chat_message.expert_id)
 
         response, _ = await get_response(
             messages=chat_message.message,
@@ -183,19 +241,23 @@ async def chat(chat_message: ChatMessage):
 
         return {"response": response}
     except Exception as e:
-        opik_tracer = OpikTracer()
-        opik_tracer.flush()
+        _flush_tracer()
 
         raise HTTPException(status_code=500, detail=str(e))
 
 
+async def _send_ws_json(websocket: WebSocket, payload: dict) -> None:
+    """Same wire format as send_json, serialised with orjson."""
+    await websocket.send_text(orjson.dumps(payload).decode())
+
+
 @app.websocket("/ws/chat")
 async def websocket_chat(websocket: WebSocket, token: str = None):
     await websocket.accept()
 
     # Verify Clerk token manually for WebSocket
     if not token:
-        await websocket.send_json({"error": "Missing authentication token"})
+        await _send_ws_json(websocket, {"error": "Missing authentication token"})
         await websocket.close()
         return
         
@@ -217,16 +279,17 @@ async def websocket_chat(websocket: WebSocket, token: str = None):
         )
         clerk_id = payload.get("sub")
     except Exception as e:
-        await websocket.send_json({"error": f"Authentication failed: {str(e)}"})
+        await _send_ws_json(websocket, {"error": f"Authentication failed: {str(e)}"})
         await websocket.close()
         return
 
     try:
         while True:
-            data = await websocket.receive_json()
+            data = orjson.loads(await websocket.receive_text())
 
             if "message" not in data or "expert_id" not in data:
-                await websocket.send_json(
+                await _send_ws_json(
+                    websocket,
                     {
                         "error": "Invalid message format. Required fields: 'message' and 'expert_id'"
                     }
@@ -235,14 +298,14 @@ async def websocket_chat(websocket: WebSocket, token: str = None):
 
             try:
                 # Signal immediately so frontend shows typing indicator
-                await websocket.send_json({"streaming": True})
+                await _send_ws_json(websocket, {"streaming": True})
 
                 # 1. Quota Check
                 from ghana_legal.infrastructure.usage import check_quota, log_usage
                 quota = await check_quota(clerk_id)
 
                 if not quota["allowed"]:
-                    await websocket.send_json({
+                    await _send_ws_json(websocket, {
                         "error": f"Daily limit reached. You have used {quota['used_today']}/{quota['daily_limit']} free queries today. Please upgrade to Pro for unlimited access.",
                         "quota_exceeded": True
                     })
@@ -252,11 +315,10 @@ async def websocket_chat(websocket: WebSocket, token: str = None):
                 cache = get_cache()
                 cached_response = cache.get(data["message"], data["expert_id"])
                 if cached_response:
-                    await websocket.send_json({"response": cached_response, "streaming": False})
+                    await _send_ws_json(websocket, {"response": cached_response, "streaming": False})
                     continue
 
-                expert_factory = LegalExpertFactory()
-                expert = expert_factory.get_legal_expert(
+                expert = LegalExpertFactory.get_legal_expert(
                     data["expert_id"]
                 )
 
@@ -271,37 +333,38 @@ async def websocket_chat(websocket: WebSocket, token: str = None):
                     clerk_id=clerk_id,
                 )
 
-                # Stream each chunk of the response
-                full_response = ""
+                # Stream each chunk of the response. get_streaming_response
+                # already coalesces tokens, so each chunk is one frame.
+                parts = []
                 sources = []
                 async for chunk in response_stream:
                     # Check for sources marker (yielded after streaming ends)
                     if chunk.startswith('{"__sources__"'):
                         try:
-                            import json
-                            sources = json.loads(chunk)["__sources__"]
+                            sources = orjson.loads(chunk)["__sources__"]
                         except Exception:
                             pass
                     else:
-                        full_response += chunk
-                        await websocket.send_json({"chunk": chunk})
+                        parts.append(chunk)
+                        await _send_ws_json(websocket, {"chunk": chunk})
+                full_response = "".join(parts)
 
                 # Cache the full response for future non-streaming requests
                 if len(full_response) > 50:
                     cache.set(data["message"], data["expert_id"], full_response, ttl=7200)
 
-                await websocket.send_json(
-                    {"response": full_response, "streaming": False, "sources": sources}
+                await _send_ws_json(
+                    websocket,
+                    {"response": full_response, "streaming": False, "sources": sources},
                 )
 
                 # 4. Log usage after successful generation
                 await log_usage(clerk_id, data["message"], data["expert_id"])
 
             except Exception as e:
-                opik_tracer = OpikTracer()
-                opik_tracer.flush()
+                _flush_tracer()
 
-                await websocket.send_json({"error": str(e)})
+                await _send_ws_json(websocket, {"error": str(e)})
 
     except WebSocketDisconnect:
         pass
@@ -352,8 +415,7 @@ async def stream_chat(body: StreamChatMessage, user: dict = Depends(get_current_
     # 3. Stream LLM response
     async def event_stream():
         try:
-            expert_factory = LegalExpertFactory()
-            expert = expert_factory.get_legal_expert(body.expert_id)
+            expert = LegalExpertFactory.get_legal_expert(body.expert_id)
 
             response_stream = get_streaming_response(
                 messages=body.message,
@@ -408,8 +470,7 @@ async def stream_chat(body: StreamChatMessage, user: dict = Depends(get_current_
             yield f"data: {json.dumps({'done': True})}\n\n"
 
         except Exception as e:
-            opik_tracer = OpikTracer()
-            opik_tracer.flush()
+            _flush_tracer()
             yield f"data: {json.dumps({'error': str(e)})}\n\n"
 
     return StreamingResponse(event_stream(), media_type="text/event-stream")
@@ -480,6 +541,18 @@ async def get_chat_history(expert_id: str, user: dict = Depends(get_current_user
 
 
 if __name__ == "__main__":
+    import sys
+
     import uvicorn
 
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop + httptools (from uvicorn[standard]) instead of the stock asyncio
+    # loop and h11 parser; uvloop has no Windows build. Scale out with
+    # --workers at the container level rather than in-process.
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=8000,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        ws="websockets",
+    )
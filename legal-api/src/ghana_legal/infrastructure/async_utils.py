@@ -0,0 +1,10 @@
+import asyncio
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+# Each call gets a fresh uvloop loop when available
+run_async = uvloop.run if UVLOOP_AVAILABLE else asyncio.run
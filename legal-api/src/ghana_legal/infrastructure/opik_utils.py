@@ -6,6 +6,8 @@ from opik.configurator.configure import OpikConfigurator
 
 from ghana_legal.config import settings
 
+_client: opik.Opik | None = None
+
 
 def configure() -> None:
     if settings.COMET_API_KEY and settings.COMET_PROJECT:
@@ -40,8 +42,16 @@ def configure() -> None:
         )
 
 
+def get_opik_client() -> opik.Opik:
+    """Get or create the process-wide Opik client."""
+    global _client
+    if _client is None:
+        _client = opik.Opik()
+    return _client
+
+
 def get_dataset(name: str) -> opik.Dataset | None:
-    client = opik.Opik()
+    client = get_opik_client()
     try:
         dataset = client.get_dataset(name=name)
     except Exception:
@@ -51,7 +61,7 @@ def get_dataset(name: str) -> opik.Dataset | None:
 
 
 def create_dataset(name: str, description: str, items: list[dict]) -> opik.Dataset:
-    client = opik.Opik()
+    client = get_opik_client()
 
     client.delete_dataset(name=name)
 
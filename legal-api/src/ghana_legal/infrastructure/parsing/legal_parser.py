@@ -1,58 +1,200 @@
+import asyncio
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import Dict, Iterator, List
 
 from langchain_core.documents import Document
 from loguru import logger
 
+from ghana_legal.config import settings
+from ghana_legal.infrastructure.file_utils import atomic_write_json
+
+
+# Map expert IDs to subdirectories
+EXPERT_DIRS = {
+    "constitutional": ["constitution"],
+    "case_law": ["supreme_court", "court_of_appeal"],
+    "legal_historian": ["statutes", "history"],  # Assuming history or statutes
+}
+
+# File types _parse_file understands
+SUPPORTED_SUFFIXES = (".txt", ".pdf")
+
+# Files read/parsed at once per directory
+PARSE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+def _iter_supported_files(root: Path) -> Iterator[os.DirEntry]:
+    """Recursively yield the directory entries of supported files under root.
+
+    Uses os.scandir so file/dir checks come from the cached readdir entry
+    instead of a stat per Path, and other files never become Path objects.
+    """
+    stack = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file() and entry.name.lower().endswith(SUPPORTED_SUFFIXES):
+                        yield entry
+        except OSError as e:
+            logger.error(f"Failed to list {e.filename}: {e}")
+
+
+def _corpus_fingerprint(file_paths: List[Path]) -> str:
+    """Hash of every file's path, size and mtime; changes when any file does."""
+    digest = hashlib.blake2b(digest_size=8)
+    for path in sorted(file_paths):
+        stat = path.stat()
+        digest.update(f"{path}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _load_docs_cache(path: Path) -> List[Document] | None:
+    """Return the cached documents for a subdirectory, or None if missing."""
+    try:
+        payload = json.loads(path.read_text())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, TypeError) as e:
+        logger.warning(f"Ignoring unreadable document cache {path}: {e}")
+        return None
+
+    # json.loads allocates a new str for every metadata value; share repeated
+    # ones (PDF producer, creator, dates...) across the documents instead
+    shared: Dict[str, str] = {}
+    try:
+        return [
+            Document(
+                page_content=doc["page_content"],
+                metadata={
+                    key: shared.setdefault(value, value) if isinstance(value, str) else value
+                    for key, value in doc["metadata"].items()
+                },
+            )
+            for doc in payload
+        ]
+    except (KeyError, TypeError, AttributeError) as e:
+        logger.warning(f"Ignoring malformed document cache {path}: {e}")
+        return None
+
+
+def _save_docs_cache(path: Path, docs: List[Document]) -> None:
+    """Save the documents for a subdirectory, dropping its stale entries."""
+    payload = [{"page_content": d.page_content, "metadata": d.metadata} for d in docs]
+    try:
+        if path.parent.exists():
+            for stale in path.parent.glob("*.json"):
+                stale.unlink(missing_ok=True)
+        atomic_write_json(path, payload, default=str)
+    except OSError as e:
+        logger.warning(f"Failed to write document cache {path}: {e}")
+
 
 class LegalDocumentLoader:
-    """Loads legal documents from the local data directory."""
+    """Loads legal documents from the local data directory.
+
+    Each subdirectory is walked and parsed once per loader; later requests
+    for it, from any expert, reuse the parsed documents. Parsed documents are
+    also cached on disk, keyed by a fingerprint of the subdirectory's files,
+    so restarts only re-parse after the corpus changes.
+    """
 
-    def __init__(self, data_dir: str = "data/ghana_legal"):
+    def __init__(self, data_dir: str = "data/ghana_legal", cache_dir: Path | None = None):
         self.data_dir = Path(data_dir)
+        if cache_dir is None and not settings.LEGAL_CACHE_DISABLE:
+            cache_dir = settings.LEGAL_DOCS_CACHE_DIR
+        self.cache_dir = cache_dir
+        self._target_docs: Dict[str, List[Document]] = {}
 
     def load_expert_documents(self, expert_id: str, expert_name: str) -> List[Document]:
         """Load documents relevant to a specific legal expert."""
-        docs = []
-
-        # Map expert IDs to subdirectories
-        expert_dirs = {
-            "constitutional": "constitution",
-            "case_law": ["supreme_court", "court_of_appeal"],
-            "legal_historian": ["statutes", "history"],  # Assuming history or statutes
-        }
-
-        if expert_id not in expert_dirs:
+        if expert_id not in EXPERT_DIRS:
             logger.warning(f"No specific directory mapping for expert {expert_id}")
             return []
 
-        targets = expert_dirs[expert_id]
-        if isinstance(targets, str):
-            targets = [targets]
-
-        for target in targets:
-            target_path = self.data_dir / target
-            if not target_path.exists():
-                logger.debug(f"Directory {target_path} does not exist, skipping.")
-                continue
-
-            # Walk through directory
-            for file_path in target_path.rglob("*"):
-                if file_path.is_file():
-                    try:
-                        doc = self._parse_file(file_path)
-                        if doc:
-                            # Enrich metadata
-                            doc.metadata["expert_id"] = expert_id
-                            doc.metadata["expert_name"] = expert_name
-                            doc.metadata["category"] = target
-                            docs.append(doc)
-                    except Exception as e:
-                        logger.error(f"Failed to parse {file_path}: {e}")
+        docs = []
+        for target in EXPERT_DIRS[expert_id]:
+            # One template per target; every copy references the same strings
+            expert_metadata = {
+                "expert_id": expert_id,
+                "expert_name": expert_name,
+                "category": target,
+            }
+            for doc in self._load_target(target):
+                # Enrich a copy so the shared parsed document stays untouched
+                docs.append(
+                    Document(
+                        page_content=doc.page_content,
+                        metadata={**doc.metadata, **expert_metadata},
+                    )
+                )
 
         logger.info(f"Loaded {len(docs)} documents for {expert_name} from local storage.")
         return docs
 
+    async def aload_expert_documents(self, expert_id: str, expert_name: str) -> List[Document]:
+        """Async load_expert_documents for callers on the event loop (e.g. a corpus reload).
+
+        The walk and cache lookup run in a worker thread, which fans file
+        parsing out to the loader's own pool, so the loop is never blocked
+        on disk reads.
+        """
+        return await asyncio.to_thread(self.load_expert_documents, expert_id, expert_name)
+
+    def _load_target(self, target: str) -> List[Document]:
+        """Parse every file under one subdirectory, at most once per loader."""
+        if target in self._target_docs:
+            return self._target_docs[target]
+
+        docs = []
+        target_path = self.data_dir / target
+        if not target_path.exists():
+            logger.debug(f"Directory {target_path} does not exist, skipping.")
+        else:
+            # Walk through directory, visiting only files we can parse
+            # Read in inode order, which tracks on-disk layout far better than
+            # readdir order; DirEntry.inode() comes from readdir, so no extra stat
+            file_paths = [
+                Path(entry.path)
+                for entry in sorted(_iter_supported_files(target_path), key=os.DirEntry.inode)
+            ]
+            cache_path = None
+            cached = None
+            if self.cache_dir is not None:
+                cache_path = self.cache_dir / target / f"{_corpus_fingerprint(file_paths)}.json"
+                cached = _load_docs_cache(cache_path)
+
+            if cached is not None:
+                logger.debug(f"Loaded {len(cached)} cached documents for {target_path}")
+                docs = cached
+            else:
+                # File reads release the GIL, so a thread pool overlaps them
+                with ThreadPoolExecutor(max_workers=PARSE_WORKERS) as executor:
+                    docs = [
+                        doc
+                        for doc in executor.map(self._try_parse_file, file_paths)
+                        if doc
+                    ]
+                if cache_path is not None:
+                    _save_docs_cache(cache_path, docs)
+
+        self._target_docs[target] = docs
+        return docs
+
+    def _try_parse_file(self, file_path: Path) -> Document | None:
+        """_parse_file, logging failures instead of raising (runs in a worker thread)."""
+        try:
+            return self._parse_file(file_path)
+        except Exception as e:
+            logger.error(f"Failed to parse {file_path}: {e}")
+            return None
+
     def _parse_file(self, file_path: Path) -> Document | None:
         """Parse a single file into a Document."""
         # Simple implementation for .txt files
@@ -95,3 +237,4 @@ class LegalDocumentLoader:
                 return None
 
         return None
+
@@ -1,6 +1,5 @@
 import os
 import asyncio
-from motor.motor_asyncio import AsyncIOMotorClient
 from dotenv import load_dotenv
 
 # Load .env explicitly
@@ -14,6 +13,8 @@ async def inspect_mongo():
         return
 
     print(f"Connecting to MongoDB...")
+    from motor.motor_asyncio import AsyncIOMotorClient
+
     try:
         client = AsyncIOMotorClient(MONGO_URI)
         
@@ -37,15 +38,20 @@ async def inspect_mongo():
         collections = await db.list_collection_names()
         print(f"   📂 Collections: {collections}")
         
-        for col_name in collections:
-            count = await db[col_name].count_documents({})
+        # Counts come from collection metadata, so fetch them all concurrently
+        # instead of running a full count_documents({}) scan per collection
+        counts = await asyncio.gather(
+            *(db[col_name].estimated_document_count() for col_name in collections)
+        )
+        
+        for col_name, count in zip(collections, counts):
             print(f"      - {col_name}: {count} documents")
             
             # Peel into one doc to see structure
             if count > 0:
                 doc = await db[col_name].find_one()
-                keys = list(doc.keys())
-                print(f"        Keys: {keys}")
+                if doc:
+                    print(f"        Keys: {list(doc.keys())}")
 
     except Exception as e:
         print(f"❌ Error: {e}")
@@ -10,6 +10,7 @@ logger = logging.getLogger(__name__)
 PDF_URL = "https://constitutionnet.org/sites/default/files/Ghana%20Constitution.pdf"
 DEST_DIR = "data/ghana_legal/constitution"
 DEST_FILE = os.path.join(DEST_DIR, "Constitution_of_Ghana_1992.pdf")
+CHUNK_SIZE = 64 * 1024
 
 def download_constitution():
     if not os.path.exists(DEST_DIR):
@@ -22,14 +23,19 @@ def download_constitution():
 
     logger.info(f"Downloading PDF from {PDF_URL}...")
     try:
-        response = requests.get(PDF_URL, timeout=30)
-        response.raise_for_status()
-        
-        with open(DEST_FILE, "wb") as f:
-            f.write(response.content)
-            
+        # Stream to disk so peak memory is one chunk, not the whole PDF
+        with requests.get(PDF_URL, timeout=30, stream=True) as response:
+            response.raise_for_status()
+
+            with open(DEST_FILE, "wb") as f:
+                for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                    f.write(chunk)
+
         logger.info(f"✅ Downloaded: {DEST_FILE}")
     except Exception as e:
+        # Otherwise the next run finds DEST_FILE and returns without re-downloading
+        if os.path.exists(DEST_FILE):
+            os.remove(DEST_FILE)
         logger.error(f"Failed to download: {e}")
 
 if __name__ == "__main__":
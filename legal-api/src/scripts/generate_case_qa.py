@@ -8,60 +8,75 @@ import os
 import json
 import asyncio
 import logging
+from concurrent.futures import Executor, ProcessPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any
 
+import orjson
 from dotenv import load_dotenv
 
+from llm_utils import build_groq_llm, loads_json_reply
+
 # Load .env from the correct location
 env_path = Path("/Users/silasgah/Documents/llm/agents_project/philoagents-course/ghana-legal-ai/legal-api/src/.env")
 load_dotenv(env_path)
 
-from langchain_groq import ChatGroq
-from langchain_core.prompts import ChatPromptTemplate
-
-# Try pypdf first, fall back to PyPDF2
-try:
-    from pypdf import PdfReader
-except ImportError:
-    from PyPDF2 import PdfReader
-
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
 # Configuration
 CASES_DIR = Path("/Users/silasgah/Documents/llm/agents_project/philoagents-course/ghana-legal-ai/data/cases")
 OUTPUT_FILE = Path("/Users/silasgah/Documents/llm/agents_project/philoagents-course/ghana-legal-ai/ghana_legal_finetune_expanded.json")
+# Columnar copy of OUTPUT_FILE that upload_dataset.py loads straight into Arrow
+OUTPUT_PARQUET = OUTPUT_FILE.with_suffix(".parquet")
 EXISTING_DATA = Path("/Users/silasgah/Documents/llm/agents_project/philoagents-course/ghana-legal-ai/ghana_legal_finetune.json")
 
 # Groq settings
 GROQ_API_KEY = os.getenv("GROQ_API_KEY")
 GROQ_MODEL = "llama-3.3-70b-versatile"  # Best for Q&A generation
+MAX_CONCURRENT_REQUESTS = 8
+REQUESTS_PER_SECOND = 0.5  # 30 RPM
+
+
+def _extract_pdf_text(path: str) -> str:
+    """Extract text from a PDF file (module-level so it can run in a worker process)."""
+    pdf_path = Path(path)
+    # Try pypdf first, fall back to PyPDF2
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        from PyPDF2 import PdfReader
+
+    try:
+        reader = PdfReader(str(pdf_path))
+        text = ""
+        for page in reader.pages:
+            page_text = page.extract_text()
+            if page_text:
+                text += page_text + "\n"
+        return text.strip()
+    except Exception as e:
+        logger.warning(f"Failed to extract text from {pdf_path.name}: {e}")
+        return ""
+
 
 class CaseQAGenerator:
     def __init__(self):
         if not GROQ_API_KEY:
             raise ValueError("GROQ_API_KEY not found in environment")
-        
-        self.llm = ChatGroq(
-            model=GROQ_MODEL,
-            api_key=GROQ_API_KEY,
-            temperature=0.7
+
+        self.llm = build_groq_llm(
+            GROQ_MODEL, REQUESTS_PER_SECOND, MAX_CONCURRENT_REQUESTS, api_key=GROQ_API_KEY
         )
     
-    def extract_text_from_pdf(self, pdf_path: Path) -> str:
-        """Extract text from a PDF file."""
-        try:
-            reader = PdfReader(str(pdf_path))
-            text = ""
-            for page in reader.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
-            return text.strip()
-        except Exception as e:
-            logger.warning(f"Failed to extract text from {pdf_path.name}: {e}")
-            return ""
+    async def extract_text_from_pdf(self, pdf_path: Path, executor: Executor | None = None) -> str:
+        """Extract text from a PDF file in ``executor``, off the event loop.
+
+        pypdf is pure Python, so a process pool lets PDFs parse in parallel
+        while Groq requests for earlier cases are in flight.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, _extract_pdf_text, str(pdf_path))
     
     def chunk_text(self, text: str, chunk_size: int = 3000, overlap: int = 200) -> List[str]:
         """Split text into overlapping chunks."""
@@ -72,16 +87,15 @@ class CaseQAGenerator:
         start = 0
         while start < len(text):
             end = start + chunk_size
-            chunk = text[start:end]
             
-            # Try to break at sentence boundary
+            # Try to break at sentence boundary, searching the original
+            # string in place instead of slicing a candidate chunk first
             if end < len(text):
-                last_period = chunk.rfind('.')
-                if last_period > chunk_size // 2:
-                    chunk = chunk[:last_period + 1]
-                    end = start + last_period + 1
+                last_period = text.rfind('.', start + chunk_size // 2 + 1, end)
+                if last_period != -1:
+                    end = last_period + 1
             
-            chunks.append(chunk)
+            chunks.append(text[start:end])
             start = end - overlap
         
         return chunks
@@ -114,6 +128,8 @@ class CaseQAGenerator:
         ]
         """
         
+        from langchain_core.prompts import ChatPromptTemplate
+
         prompt = ChatPromptTemplate.from_messages([
             ("system", system_prompt),
             ("human", f"Case: {case_name}\n\nText:\n{context[:4000]}")  # Limit context size
@@ -124,21 +140,14 @@ class CaseQAGenerator:
         try:
             response = await chain.ainvoke({})
             content = response.content.strip()
-            
-            # Clean up markdown if present
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0].strip()
-            elif "```" in content:
-                content = content.split("```")[1].split("```")[0].strip()
-            
-            data = json.loads(content)
+            data = loads_json_reply(content)
             
             if isinstance(data, dict):
                 data = [data]
             
             return data
             
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.warning(f"JSON parse error for {case_name}: {e}")
             return []
         except Exception as e:
@@ -151,39 +160,56 @@ class CaseQAGenerator:
         pdf_files = list(CASES_DIR.glob("*.pdf"))[:max_cases]
         logger.info(f"Found {len(pdf_files)} PDF files to process")
         
-        all_pairs = []
-        
-        for i, pdf_path in enumerate(pdf_files):
+        sem = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+        async def _bounded(chunk: str, case_name: str) -> List[Dict[str, Any]]:
+            async with sem:
+                return await self.generate_qa_pairs(chunk, case_name)
+
+        async def _process_case(i: int, pdf_path: Path, pool: Executor) -> list:
             logger.info(f"[{i+1}/{len(pdf_files)}] Processing: {pdf_path.name[:50]}...")
             
             # Extract text
-            text = self.extract_text_from_pdf(pdf_path)
+            text = await self.extract_text_from_pdf(pdf_path, pool)
             if not text or len(text) < 500:
-                logger.warning(f"  Skipping - insufficient text content")
-                continue
+                logger.warning(f"  Skipping {pdf_path.name[:50]} - insufficient text content")
+                return []
             
             # Chunk the text
             chunks = self.chunk_text(text)
-            logger.info(f"  Split into {len(chunks)} chunks")
+            logger.info(f"  {pdf_path.name[:50]}: split into {len(chunks)} chunks")
             
             # Process first 2 chunks per case (to avoid too many similar questions)
-            for chunk_idx, chunk in enumerate(chunks[:2]):
-                pairs = await self.generate_qa_pairs(chunk, pdf_path.stem)
-                
-                # Convert to ShareGPT format
-                for pair in pairs:
-                    sharegpt_entry = {
-                        "conversations": [
-                            {"from": "human", "value": pair.get("instruction", "")},
-                            {"from": "gpt", "value": pair.get("output", "")}
-                        ]
-                    }
-                    all_pairs.append(sharegpt_entry)
-                
-                logger.info(f"  Chunk {chunk_idx+1}: Generated {len(pairs)} pairs")
-                
-                # Rate limiting
-                await asyncio.sleep(1)
+            chunks = chunks[:2]
+            results = await asyncio.gather(
+                *(_bounded(chunk, pdf_path.stem) for chunk in chunks),
+                return_exceptions=True,
+            )
+            return [(pdf_path.stem, chunk_idx, pairs) for chunk_idx, pairs in enumerate(results)]
+
+        # Each case's Groq calls start as soon as its own PDF is parsed
+        with ProcessPoolExecutor() as pool:
+            per_case = await asyncio.gather(
+                *(_process_case(i, pdf_path, pool) for i, pdf_path in enumerate(pdf_files))
+            )
+
+        all_pairs = []
+        for case_name, chunk_idx, pairs in (job for case in per_case for job in case):
+            if isinstance(pairs, Exception):
+                logger.warning(f"Failed to generate QA for {case_name}: {pairs}")
+                continue
+
+            # Convert to ShareGPT format
+            for pair in pairs:
+                sharegpt_entry = {
+                    "conversations": [
+                        {"from": "human", "value": pair.get("instruction", "")},
+                        {"from": "gpt", "value": pair.get("output", "")}
+                    ]
+                }
+                all_pairs.append(sharegpt_entry)
+
+            logger.info(f"  {case_name[:50]} chunk {chunk_idx+1}: Generated {len(pairs)} pairs")
         
         return all_pairs
     
@@ -202,6 +228,23 @@ class CaseQAGenerator:
         return combined
 
 
+def write_parquet(pairs: List[Dict], path: Path) -> None:
+    """Write ShareGPT pairs as flat instruction/output/conversations rows."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    rows = [
+        {
+            "instruction": item["conversations"][0]["value"],
+            "output": item["conversations"][1]["value"],
+            "conversations": item["conversations"],
+        }
+        for item in pairs
+        if len(item["conversations"]) >= 2
+    ]
+    pq.write_table(pa.Table.from_pylist(rows), path, compression="zstd")
+
+
 async def main():
     print("🇬🇭 Ghana Legal Case Q&A Generator")
     print("=" * 50)
@@ -218,8 +261,9 @@ async def main():
     # Save expanded dataset
     with open(OUTPUT_FILE, "w") as f:
         json.dump(combined, f, indent=2)
+    write_parquet(combined, OUTPUT_PARQUET)
     
-    print(f"\n✅ Saved {len(combined)} total pairs to: {OUTPUT_FILE}")
+    print(f"\n✅ Saved {len(combined)} total pairs to: {OUTPUT_FILE} (+ {OUTPUT_PARQUET.name})")
     print(f"   - Existing pairs: {len(combined) - len(new_pairs)}")
     print(f"   - New from cases: {len(new_pairs)}")
 
@@ -1,5 +1,5 @@
+import hashlib
 import os
-import json
 import logging
 import asyncio
 from typing import List, Dict, Any, Optional
@@ -9,25 +9,101 @@ from dotenv import load_dotenv
 # Load .env explicitly for Pydantic Settings
 load_dotenv("legal-api/src/.env")  # Adjusted path relative to project root
 
+# Motor's executor only ever runs a query or two here; read at motor import
+os.environ.setdefault("MOTOR_MAX_WORKERS", "1")
+
+import orjson
+import tiktoken
 from motor.motor_asyncio import AsyncIOMotorClient
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_groq import ChatGroq
 
 # Import settings from project config to ensure consistency
 from ghana_legal.config import settings
 
+from llm_utils import build_groq_llm, loads_json_reply
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
+# Groq calls in flight at once
+MAX_CONCURRENT_REQUESTS = 8
+# Document chunks sent together in one Groq call
+CHUNKS_PER_REQUEST = 4
+
+# Prompt budget per request; contexts are trimmed to fit. The overhead covers
+# the "### Context i ###" headers and chat formatting.
+MAX_INPUT_TOKENS = 6000
+PROMPT_OVERHEAD_TOKENS = 512
+
+QA_SYSTEM_PROMPT = """
+        You are a Senior Judge of the Supreme Court of Ghana. 
+        Your task is to generate high-quality training data for a junior legal AI.
+        
+        Read each of the provided, numbered legal texts (Contexts). 
+        For every context, generate 3 distinct question-and-answer pairs based strictly on that text.
+        
+        The pairs should cover:
+        1. Factual Recall (e.g., "What does Article X say?")
+        2. Legal Reasoning (e.g., "Does a person have the right to...?")
+        3. Exclusionary (e.g., "Is it constitutional to...?")
+
+        Output purely a JSON list with one object per context, with keys: "context_id" (the context's number)
+        and "qa" (a list of objects with keys: "instruction" and "output").
+        
+        Example Output Format:
+        [
+            {{"context_id": 1, "qa": [
+                {{"instruction": "What is the capital?", "output": "Accra."}},
+                {{"instruction": "Explain...?", "output": "Because..."}}
+            ]}}
+        ]
+        """
+
+def parse_batch_reply(content: str, num_contexts: int) -> List[List[Dict[str, Any]]]:
+    """Split a batched reply into one list of QA pairs per context.
+
+    Items are matched to contexts by their 1-based ``context_id``. A flat pair
+    without one is kept under the first context; anything else is dropped.
+
+    Raises:
+        orjson.JSONDecodeError: If the reply holds no valid JSON.
+    """
+    results: List[List[Dict[str, Any]]] = [[] for _ in range(num_contexts)]
+
+    data = loads_json_reply(content)
+
+    # Ensure it's a list
+    if isinstance(data, dict):
+        data = [data]
+
+    for item in data:
+        if not isinstance(item, dict):
+            continue
+        context_id = item.get("context_id")
+        if "qa" in item and isinstance(context_id, int) and 1 <= context_id <= num_contexts:
+            qa = item["qa"]
+            results[context_id - 1].extend(
+                pair for pair in (qa if isinstance(qa, list) else [qa]) if isinstance(pair, dict)
+            )
+        elif "instruction" in item:
+            # Flat pair without a context_id; keep it rather than drop it
+            results[0].append(item)
+
+    return results
+
+
 class SyntheticDataGenerator:
     def __init__(self, model_name: str = None):
         self.model_name = model_name or settings.GROQ_LLM_MODEL
-        self.llm = ChatGroq(
-            model=self.model_name,
+        self.llm = build_groq_llm(
+            self.model_name,
+            settings.GROQ_REQUESTS_PER_SECOND,
+            MAX_CONCURRENT_REQUESTS,
             api_key=settings.GROQ_API_KEY,
-            temperature=0.7
         )
+        self.encoding = tiktoken.get_encoding("cl100k_base")
+        self.system_prompt_tokens = len(self.encoding.encode(QA_SYSTEM_PROMPT))
         self.client = AsyncIOMotorClient(settings.MONGO_URI)
         self.db = self.client[settings.MONGO_DB_NAME]
         self.collection = self.db[settings.MONGO_LONG_TERM_MEMORY_COLLECTION]
@@ -35,16 +111,24 @@ class SyntheticDataGenerator:
     async def fetch_random_documents(self, sample_size: int = 50) -> List[str]:
         """Fetch random document chunks from MongoDB."""
         try:
-            # Use aggregation for random sampling
-            pipeline = [{"$sample": {"size": sample_size}}]
-            cursor = self.collection.aggregate(pipeline)
-            
-            documents = []
-            async for doc in cursor:
+            # Use aggregation for random sampling. $sample stays first so MongoDB
+            # can use its random-cursor fast path; the rest runs server-side so
+            # only usable chunk text crosses the wire.
+            pipeline = [
+                {"$sample": {"size": sample_size}},
                 # Assuming standard LangChain vector store structure: text is in 'text' or 'page_content' field
-                text = doc.get("text") or doc.get("page_content")
-                if text and len(text) > 200:  # Filter out tiny chunks
-                    documents.append(text)
+                {"$project": {"_id": 0, "text": {"$ifNull": ["$text", "$page_content"]}}},
+                {"$match": {"text": {"$type": "string"}}},
+                # Filter out tiny chunks
+                {"$match": {"$expr": {"$gt": [{"$strLenCP": "$text"}, 200]}}},
+                # $sample may return the same document more than once
+                {"$group": {"_id": "$text"}},
+            ]
+            # One batch holds the whole sample, so it arrives in a single awaitable
+            docs = await self.collection.aggregate(pipeline, batchSize=sample_size).to_list(
+                length=sample_size
+            )
+            documents = [doc["_id"] for doc in docs]
             
             logger.info(f"Fetched {len(documents)} document chunks from MongoDB.")
             return documents
@@ -52,74 +136,95 @@ class SyntheticDataGenerator:
             logger.error(f"Error fetching documents: {e}")
             return []
 
-    async def generate_qa_pairs(self, context_text: str) -> List[Dict[str, Any]]:
-        """Generate Q&A pairs from a single document chunk."""
-        
-        system_prompt = """
-        You are a Senior Judge of the Supreme Court of Ghana. 
-        Your task is to generate high-quality training data for a junior legal AI.
-        
-        Read the provided legal text (Context). 
-        Generate 3 distinct question-and-answer pairs based strictly on this text.
-        
-        The pairs should cover:
-        1. Factual Recall (e.g., "What does Article X say?")
-        2. Legal Reasoning (e.g., "Does a person have the right to...?")
-        3. Exclusionary (e.g., "Is it constitutional to...?")
+    def fit_to_budget(self, contexts: List[str]) -> List[str]:
+        """Trim contexts so the whole request stays within MAX_INPUT_TOKENS.
 
-        Output purely a JSON list of objects with keys: "instruction" and "output".
-        
-        Example Output Format:
-        [
-            {{"instruction": "What is the capital?", "output": "Accra."}},
-            {{"instruction": "Explain...?", "output": "Because..."}}
-        ]
+        Oversized prompts are otherwise truncated by Groq or rejected with a 413.
+        """
+        budget = (MAX_INPUT_TOKENS - self.system_prompt_tokens - PROMPT_OVERHEAD_TOKENS) // len(contexts)
+        token_lists = self.encoding.encode_batch(contexts, disallowed_special=())
+        fitted = []
+        for text, tokens in zip(contexts, token_lists):
+            if len(tokens) > budget:
+                logger.info(f"Trimming context from {len(tokens)} to {budget} tokens")
+                text = self.encoding.decode(tokens[:budget])
+            fitted.append(text)
+        return fitted
+
+    async def generate_qa_pairs_batch(self, contexts: List[str]) -> List[List[Dict[str, Any]]]:
+        """Generate Q&A pairs for several document chunks in one request.
+
+        Returns one list of pairs per context, in the same order.
         """
         
+        # Contexts are passed as a variable so braces in the text aren't
+        # treated as template fields
         prompt = ChatPromptTemplate.from_messages([
-            ("system", system_prompt),
-            ("human", f"Context: {context_text}")
+            ("system", QA_SYSTEM_PROMPT),
+            ("human", "{contexts}")
         ])
         
         chain = prompt | self.llm
+        results: List[List[Dict[str, Any]]] = [[] for _ in contexts]
+        contexts = self.fit_to_budget(contexts)
         
         try:
-            response = await chain.ainvoke({})
-            content = response.content
-            
-            # Identify JSON block if wrapped in markdown
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0].strip()
-            elif "```" in content:
-                content = content.split("```")[1].strip()
-                
-            data = json.loads(content)
-            
-            # Ensure it's a list
-            if isinstance(data, dict):
-                data = [data]
-                
-            return data
+            response = await chain.ainvoke({
+                "contexts": "\n\n".join(
+                    f"### Context {i} ###\n{text}" for i, text in enumerate(contexts, 1)
+                )
+            })
+            return parse_batch_reply(response.content, len(contexts))
             
         except Exception as e:
             logger.warning(f"Failed to generate QA pairs: {e}")
-            return []
+            return results
 
     async def build_dataset(self, num_chunks: int = 20, output_file: str = "ghana_legal_finetune.json"):
         """Main execution flow."""
         logger.info(f"Starting synthetic data generation (Chunks: {num_chunks})...")
         
         chunks = await self.fetch_random_documents(num_chunks)
-        full_dataset = []
 
+        sem = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+        async def _bounded(start: int, group: List[str]) -> List[Dict[str, Any]]:
+            async with sem:
+                logger.info(f"Processing chunks {start+1}-{start+len(group)}/{len(chunks)}...")
+                try:
+                    per_chunk = await self.generate_qa_pairs_batch(group)
+                except Exception as e:
+                    logger.warning(f"Failed to generate QA pairs for chunks {start+1}-{start+len(group)}: {e}")
+                    return []
+                return [pair for pairs in per_chunk for pair in pairs]
+
+        # Several chunks share one request, so the system prompt is paid once per group
+        tasks = [
+            asyncio.create_task(_bounded(start, chunks[start:start + CHUNKS_PER_REQUEST]))
+            for start in range(0, len(chunks), CHUNKS_PER_REQUEST)
+        ]
+
+        # Stream entries into the JSON array as each chunk completes, so only
+        # one chunk's pairs are held in memory and finished work is on disk
         total_pairs = 0
-        for i, chunk in enumerate(chunks):
-            logger.info(f"Processing chunk {i+1}/{len(chunks)}...")
-            pairs = await self.generate_qa_pairs(chunk)
-            
-            if pairs:
+        duplicates = 0
+        # Digests of instructions already written; chunks often yield the same question
+        seen: set[bytes] = set()
+        separator = b"\n"
+        with open(output_file, "wb") as f:
+            f.write(b"[")
+            for future in asyncio.as_completed(tasks):
+                pairs = await future
                 # Convert to ShareGPT / Unsloth Format
                 for pair in pairs:
+                    key = hashlib.blake2b(
+                        str(pair.get("instruction", ""))[:256].encode("utf-8"), digest_size=16
+                    ).digest()
+                    if key in seen:
+                        duplicates += 1
+                        continue
+                    seen.add(key)
+                    total_pairs += 1
                     sharegpt_entry = {
                         "conversations": [
                             {
@@ -132,16 +237,13 @@ class SyntheticDataGenerator:
                             }
                         ]
                     }
-                    full_dataset.append(sharegpt_entry)
-                
-                total_pairs += len(pairs)
-                # Sleep briefly to respect rate limits
-                await asyncio.sleep(1) 
-
-        # Save to file
-        with open(output_file, "w") as f:
-            json.dump(full_dataset, f, indent=2)
-            
+                    f.write(separator + orjson.dumps(sharegpt_entry))
+                    separator = b",\n"
+                f.flush()
+            f.write(b"\n]\n")
+
+        if duplicates:
+            logger.info(f"Skipped {duplicates} duplicate instructions")
         logger.info(f"✅ Success! Saved {total_pairs} pairs to {output_file}")
 
 
@@ -1,12 +1,14 @@
 import os
 import asyncio
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from typing import List
 
 from langchain_community.document_loaders import PyPDFLoader
+from langchain_core.documents import Document
 from langchain_text_splitters import RecursiveCharacterTextSplitter
-from langchain_mongodb import MongoDBAtlasVectorSearch
-from pymongo import MongoClient
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo.errors import BulkWriteError
 from dotenv import load_dotenv
 
 # Load .env explicitly for Pydantic Settings
@@ -27,11 +29,42 @@ DATA_DIRS = [
     os.path.join(PROJECT_ROOT, "data/ghana_legal/constitution"),
     os.path.join(PROJECT_ROOT, "data/ghana_legal/cases")
 ]
+# Chunks embedded and written per insert_many call
+INSERT_BATCH_SIZE = 1000
 
-def ingest_legal_docs():
+# Shared by every _load_and_split call in a process
+_SPLITTER = RecursiveCharacterTextSplitter(
+    chunk_size=1000,
+    chunk_overlap=200,
+    separators=["\n\n", "\n", " ", ""]
+)
+
+
+def _load_and_split(file_path: str, source_type: str, file_name: str) -> List[Document]:
+    """Load and chunk one PDF (module-level so it can run in a worker process)."""
+    try:
+        loader = PyPDFLoader(file_path)
+        docs = loader.load()
+        
+        # Split Text
+        chunks = _SPLITTER.split_documents(docs)
+        
+        # Add metadata to help retrieval/training know source type
+        for chunk in chunks:
+            chunk.metadata["source_type"] = source_type
+            chunk.metadata["file_name"] = file_name
+        
+        return chunks
+        
+    except Exception as e:
+        logger.error(f"Failed to process {file_name}: {e}")
+        return []
+
+
+async def ingest_legal_docs():
     """Ingest legal PDFs (Constitution & Cases) into MongoDB Atlas Vector Store."""
     
-    all_chunks = []
+    tasks = []
     
     # Iterate over all source directories
     for data_dir in DATA_DIRS:
@@ -46,32 +79,16 @@ def ingest_legal_docs():
             
         logger.info(f"Found {len(pdf_files)} PDF(s) in {data_dir}")
         
-        for pdf in pdf_files:
-            file_path = os.path.join(data_dir, pdf)
-            logger.info(f"Processing: {pdf}")
-            try:
-                loader = PyPDFLoader(file_path)
-                docs = loader.load()
-                
-                # Split Text
-                splitter = RecursiveCharacterTextSplitter(
-                    chunk_size=1000,
-                    chunk_overlap=200,
-                    separators=["\n\n", "\n", " ", ""]
-                )
-                chunks = splitter.split_documents(docs)
-                
-                # Add metadata to help retrieval/training know source type
-                source_type = "constitution" if "constitution" in data_dir else "case_law"
-                for chunk in chunks:
-                    chunk.metadata["source_type"] = source_type
-                    chunk.metadata["file_name"] = pdf
-                    
-                all_chunks.extend(chunks)
-                logger.info(f"  -> Extracted {len(chunks)} chunks")
-                
-            except Exception as e:
-                logger.error(f"Failed to process {pdf}: {e}")
+        source_type = "constitution" if "constitution" in data_dir else "case_law"
+        tasks.extend((os.path.join(data_dir, pdf), source_type, pdf) for pdf in pdf_files)
+    
+    all_chunks = []
+    
+    # PDF parsing and splitting are CPU-bound, so spread them across cores
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for (_, _, pdf), chunks in zip(tasks, executor.map(_load_and_split, *zip(*tasks))):
+            logger.info(f"Processed: {pdf} -> Extracted {len(chunks)} chunks")
+            all_chunks.extend(chunks)
 
     if not all_chunks:
         logger.warning("No chunks found to ingest across all directories.")
@@ -83,17 +100,42 @@ def ingest_legal_docs():
 
     # 4. Connect to MongoDB
     logger.info("Connecting to MongoDB Atlas...")
-    client = MongoClient(settings.MONGO_URI)
+    client = AsyncIOMotorClient(settings.MONGO_URI)
     collection = client[settings.MONGO_DB_NAME][settings.MONGO_LONG_TERM_MEMORY_COLLECTION]
     
+    async def _insert(start: int, records: List[dict]) -> int:
+        try:
+            # Unordered: the server applies the batch without stopping at the first error
+            result = await collection.insert_many(records, ordered=False)
+            return len(result.inserted_ids)
+        except BulkWriteError as e:
+            logger.error(f"{len(e.details.get('writeErrors', []))} inserts failed in batch at {start}")
+            return e.details.get("nInserted", 0)
+    
     # 5. Ingest
     logger.info(f"Ingesting {len(all_chunks)} vectors into MongoDB...")
-    MongoDBAtlasVectorSearch.from_documents(
-        documents=all_chunks,
-        embedding=embeddings,
-        collection=collection,
-        index_name="default"
-    )
+    inserted = 0
+    pending = None
+    try:
+        for start in range(0, len(all_chunks), INSERT_BATCH_SIZE):
+            batch = all_chunks[start:start + INSERT_BATCH_SIZE]
+            # Embeds this batch while the previous one is still being written
+            vectors = await embeddings.aembed_documents([chunk.page_content for chunk in batch])
+            # Same document shape MongoDBAtlasVectorSearch writes, so the "default"
+            # vector index and existing readers see no difference
+            records = [
+                {"text": chunk.page_content, "embedding": vector, **chunk.metadata}
+                for chunk, vector in zip(batch, vectors)
+            ]
+            if pending is not None:
+                inserted += await pending
+                logger.info(f"  -> Inserted {inserted}/{len(all_chunks)}")
+            pending = asyncio.create_task(_insert(start, records))
+        if pending is not None:
+            inserted += await pending
+            logger.info(f"  -> Inserted {inserted}/{len(all_chunks)}")
+    finally:
+        client.close()
     
     logger.info("✅ Ingestion Complete!")
 
@@ -102,4 +144,4 @@ if __name__ == "__main__":
     for d in DATA_DIRS:
         os.makedirs(d, exist_ok=True)
         
-    ingest_legal_docs()
+    asyncio.run(ingest_legal_docs())
@@ -0,0 +1,55 @@
+"""Helpers shared by the Groq-backed training-data generators."""
+
+import re
+from typing import Any
+
+import orjson
+
+# Body of a ```json / ``` fence in the model's reply (closing fence optional)
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)\s*(?:```|\Z)", re.S)
+
+
+def loads_json_reply(content: str) -> Any:
+    """Parse a model reply as JSON, unwrapping a markdown code fence if present.
+
+    Raises:
+        orjson.JSONDecodeError: If the reply holds no valid JSON.
+    """
+    match = _JSON_FENCE_RE.search(content)
+    if match:
+        content = match.group(1)
+    return orjson.loads(content)
+
+
+def build_groq_llm(model: str, rps: float, burst: int, api_key: str | None = None):
+    """Build a ChatGroq client paced by a token bucket and retried on transient errors.
+
+    Args:
+        model: Groq model name.
+        rps: Sustained requests per second allowed by the plan.
+        burst: Requests the bucket may release back to back.
+        api_key: Groq API key; ChatGroq falls back to ``GROQ_API_KEY`` if unset.
+    """
+    # Heavy imports are deferred so callers' --help and import stay fast
+    import groq
+    from langchain_core.rate_limiters import InMemoryRateLimiter
+    from langchain_groq import ChatGroq
+
+    # Token bucket paces requests to the plan's rate instead of a fixed sleep
+    return ChatGroq(
+        model=model,
+        api_key=api_key,
+        temperature=0.7,
+        max_retries=5,
+        rate_limiter=InMemoryRateLimiter(requests_per_second=rps, max_bucket_size=burst),
+    ).with_retry(
+        # The client's own retries back off for seconds; this outer layer
+        # rides out a rate-limit window instead of dropping the chunk
+        retry_if_exception_type=(
+            groq.RateLimitError,
+            groq.InternalServerError,
+            groq.APIConnectionError,
+        ),
+        stop_after_attempt=3,
+        exponential_jitter_params={"initial": 1, "max": 30},
+    )
@@ -5,40 +5,66 @@ Upload Ghana Legal Training Dataset to HuggingFace Hub
 
 import json
 from pathlib import Path
-from datasets import Dataset
+from datasets import Dataset, Features, Value
 from huggingface_hub import HfApi, login
 import os
 
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 # Configuration
 DATASET_PATH = Path("/Users/silasgah/Documents/llm/agents_project/philoagents-course/ghana-legal-ai/ghana_legal_finetune_expanded.json")
+# Written next to DATASET_PATH by generate_case_qa.py
+DATASET_PARQUET_PATH = DATASET_PATH.with_suffix(".parquet")
 REPO_NAME = "gahsilas/ghana-legal-qa"
 
+# Declared up front so datasets doesn't infer types from the rows
+FEATURES = Features({
+    "instruction": Value("string"),
+    "output": Value("string"),
+    "conversations": [{"from": Value("string"), "value": Value("string")}],
+})
+
+def iter_examples(path: str, mtime_ns: int):
+    """Yield flat rows from the ShareGPT JSON array, one entry at a time.
+
+    ``mtime_ns`` only feeds the datasets cache fingerprint, so an edited file
+    isn't served from a stale Arrow cache.
+    """
+    with open(path, "rb") as f:
+        # ijson parses the array incrementally; without it, fall back to a full load
+        items = ijson.items(f, "item") if IJSON_AVAILABLE else json.load(f)
+        for item in items:
+            convos = item["conversations"]
+            if len(convos) >= 2:
+                yield {
+                    "instruction": convos[0]["value"],
+                    "output": convos[1]["value"],
+                    "conversations": convos,
+                }
+
 def main():
     print("📤 Uploading Ghana Legal Dataset to HuggingFace Hub")
     print("=" * 50)
     
-    # Load JSON data
-    with open(DATASET_PATH) as f:
-        data = json.load(f)
-    
-    print(f"✅ Loaded {len(data)} training examples")
-    
-    # Convert to flat format for HuggingFace datasets
-    flat_data = {
-        "instruction": [],
-        "output": [],
-        "conversations": []
-    }
-    
-    for item in data:
-        convos = item["conversations"]
-        if len(convos) >= 2:
-            flat_data["instruction"].append(convos[0]["value"])
-            flat_data["output"].append(convos[1]["value"])
-            flat_data["conversations"].append(convos)
-    
-    # Create HuggingFace Dataset
-    dataset = Dataset.from_dict(flat_data)
+    # Create HuggingFace Dataset. Prefer the Parquet copy, which maps straight
+    # into Arrow, unless the JSON has been edited since it was written.
+    if (
+        DATASET_PARQUET_PATH.exists()
+        and DATASET_PARQUET_PATH.stat().st_mtime_ns >= DATASET_PATH.stat().st_mtime_ns
+    ):
+        dataset = Dataset.from_parquet(str(DATASET_PARQUET_PATH))
+    else:
+        # Stream rows into Arrow instead of building the whole list and a
+        # flat copy of it in memory
+        dataset = Dataset.from_generator(
+            iter_examples,
+            features=FEATURES,
+            gen_kwargs={"path": str(DATASET_PATH), "mtime_ns": DATASET_PATH.stat().st_mtime_ns},
+        )
     print(f"✅ Created dataset with {len(dataset)} rows")
     print(f"   Columns: {dataset.column_names}")
     
@@ -6,9 +6,17 @@ modules touching ghana_legal.config can run without a real .env file.
 Sets VECTOR_DB_MODE=qdrant + dummy QDRANT_URL so the chroma retriever path
 (which eagerly loads a HuggingFace model on import) is bypassed during pure
 unit tests that don't actually call retrieval.
+
+Caches DeepEval judge-model responses under tests/.deepeval_cache so repeat
+evaluation runs don't re-query the judge for identical prompts.
 """
 
+import hashlib
+import json
 import os
+from pathlib import Path
+
+import pytest
 
 # Set BEFORE any ghana_legal import resolves the settings singleton.
 os.environ.setdefault("GROQ_API_KEY", "test-dummy")
@@ -16,3 +24,74 @@ os.environ.setdefault("OPENAI_API_KEY", "test-dummy")
 os.environ.setdefault("VECTOR_DB_MODE", "qdrant")
 os.environ.setdefault("QDRANT_URL", "http://test-dummy.invalid")
 os.environ.setdefault("QDRANT_API_KEY", "test-dummy")
+
+# Judge-LLM responses, keyed by model + prompt + output schema. The DeepEval
+# test inputs are fixed, so re-runs read verdicts from disk instead of
+# re-querying the judge. Set DEEPEVAL_NOCACHE=1 to bypass.
+DEEPEVAL_CACHE_DIR = Path(__file__).parent / ".deepeval_cache"
+
+
+def _judge_cache_path(model_name: str, prompt, schema) -> Path:
+    schema_name = schema.__name__ if schema is not None else ""
+    key = hashlib.blake2b(
+        f"{model_name}\0{schema_name}\0{prompt}".encode("utf-8"), digest_size=16
+    ).hexdigest()
+    return DEEPEVAL_CACHE_DIR / f"{key}.json"
+
+
+def _load_judgment(path: Path, schema):
+    try:
+        payload = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    output = payload["output"]
+    return schema.model_validate(output) if schema is not None else output
+
+
+def _save_judgment(path: Path, output) -> None:
+    # Deferred so importing conftest never triggers ghana_legal's settings load
+    from ghana_legal.infrastructure.file_utils import atomic_write_json
+
+    payload = {"output": output.model_dump() if hasattr(output, "model_dump") else output}
+    try:
+        atomic_write_json(path, payload)
+    except OSError:
+        pass
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _cache_judge_llm():
+    """Memoize DeepEval's GPTModel.generate / a_generate on disk for the session."""
+    if os.environ.get("DEEPEVAL_NOCACHE") == "1":
+        yield
+        return
+    try:
+        from deepeval.models import GPTModel
+    except ImportError:
+        yield
+        return
+
+    generate, a_generate = GPTModel.generate, GPTModel.a_generate
+
+    def cached_generate(self, prompt, schema=None):
+        path = _judge_cache_path(self.get_model_name(), prompt, schema)
+        cached = _load_judgment(path, schema)
+        if cached is not None:
+            return cached, 0.0
+        output, cost = generate(self, prompt, schema=schema)
+        _save_judgment(path, output)
+        return output, cost
+
+    async def cached_a_generate(self, prompt, schema=None):
+        path = _judge_cache_path(self.get_model_name(), prompt, schema)
+        cached = _load_judgment(path, schema)
+        if cached is not None:
+            return cached, 0.0
+        output, cost = await a_generate(self, prompt, schema=schema)
+        _save_judgment(path, output)
+        return output, cost
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(GPTModel, "generate", cached_generate)
+        mp.setattr(GPTModel, "a_generate", cached_a_generate)
+        yield
@@ -0,0 +1,53 @@
+"""Unit tests for the case downloader's request pacing.
+
+No network access — only the pacer is exercised. Run with:
+    pytest legal-api/tests/test_download_cases.py -v
+"""
+
+import asyncio
+import time
+
+from download_cases import _RequestPacer
+
+INTERVAL = 0.05
+
+
+def _request_starts(pacer: _RequestPacer, n: int) -> list[float]:
+    """Run ``n`` concurrent waits and return when each one was let through."""
+    async def _run():
+        starts = []
+
+        async def _one():
+            await pacer.wait()
+            starts.append(time.monotonic())
+
+        await asyncio.gather(*(_one() for _ in range(n)))
+        return sorted(starts)
+
+    return asyncio.run(_run())
+
+
+def test_first_request_is_not_delayed():
+    pacer = _RequestPacer(interval=INTERVAL)
+    t0 = time.monotonic()
+    (start,) = _request_starts(pacer, 1)
+    assert start - t0 < INTERVAL
+
+
+def test_concurrent_requests_are_spaced_by_the_interval():
+    starts = _request_starts(_RequestPacer(interval=INTERVAL), 4)
+    gaps = [b - a for a, b in zip(starts, starts[1:])]
+    # asyncio.sleep never wakes early, so each gap is at least the interval
+    assert all(gap >= INTERVAL * 0.95 for gap in gaps)
+
+
+def test_idle_pacer_does_not_delay_the_next_request():
+    async def _run():
+        pacer = _RequestPacer(interval=INTERVAL)
+        await pacer.wait()
+        await asyncio.sleep(INTERVAL * 2)
+        t0 = time.monotonic()
+        await pacer.wait()
+        return time.monotonic() - t0
+
+    assert asyncio.run(_run()) < INTERVAL
@@ -0,0 +1,71 @@
+"""Unit tests for the content-addressed Parquet embedding cache.
+
+Writes under tmp_path only — no embedding API. Run with:
+    pytest legal-api/tests/test_embedding_cache.py -v
+"""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from ghana_legal.application.rag.embedding_cache import EmbeddingCache, text_hash
+
+DIM = 4
+
+
+def _vectors(n, seed=0):
+    return np.random.default_rng(seed).random((n, DIM), dtype=np.float32)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return EmbeddingCache(root=tmp_path / "embeddings", model_name="voyage-law-2", dim=DIM)
+
+
+def test_empty_cache_misses(cache):
+    assert cache.get_many([text_hash("Article 1.")]) == {}
+
+
+def test_stored_vectors_are_returned(cache):
+    texts = ["Article 1.", "Article 2.", "Article 3."]
+    hashes = [text_hash(t) for t in texts]
+    vectors = _vectors(len(texts))
+    cache.put_many(hashes, vectors)
+
+    hits = cache.get_many(hashes)
+    assert set(hits) == set(hashes)
+    for h, expected in zip(hashes, vectors):
+        np.testing.assert_array_equal(hits[h], expected)
+
+
+def test_only_requested_hashes_are_returned(cache):
+    hashes = [text_hash("Article 1."), text_hash("Article 2.")]
+    cache.put_many(hashes, _vectors(2))
+
+    assert set(cache.get_many(hashes[:1])) == set(hashes[:1])
+
+
+def test_edited_text_misses(cache):
+    cache.put_many([text_hash("Article 1.")], _vectors(1))
+
+    assert cache.get_many([text_hash("Article 1. Amended.")]) == {}
+
+
+def test_appends_accumulate_across_batches(cache):
+    first, second = text_hash("Article 1."), text_hash("Article 2.")
+    cache.put_many([first], _vectors(1, seed=1))
+    cache.put_many([second], _vectors(1, seed=2))
+
+    assert set(cache.get_many([first, second])) == {first, second}
+
+
+def test_other_models_and_dims_are_isolated(cache):
+    h = text_hash("Article 1.")
+    cache.put_many([h], _vectors(1))
+
+    other_model = EmbeddingCache(root=cache.root, model_name="voyage-3", dim=DIM)
+    assert other_model.get_many([h]) == {}
+
+    other_dim = EmbeddingCache(root=cache.root, model_name=cache.model_name, dim=DIM * 2)
+    assert other_dim.get_many([h]) == {}
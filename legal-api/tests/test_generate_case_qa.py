@@ -0,0 +1,76 @@
+"""Unit tests for the case QA generator's text chunking.
+
+Pure-function tests — no Groq, no PDFs. Run with:
+    pytest legal-api/tests/test_generate_case_qa.py -v
+"""
+
+import random
+
+import pytest
+
+from generate_case_qa import CaseQAGenerator
+
+
+def _chunk(text, **kwargs):
+    # chunk_text doesn't touch the Groq client, so skip __init__
+    return CaseQAGenerator.__new__(CaseQAGenerator).chunk_text(text, **kwargs)
+
+
+def _reference_chunk(text, chunk_size=3000, overlap=200):
+    """The original slicing implementation, kept as an oracle."""
+    if len(text) <= chunk_size:
+        return [text]
+    chunks = []
+    start = 0
+    while start < len(text):
+        end = start + chunk_size
+        chunk = text[start:end]
+        if end < len(text):
+            last_period = chunk.rfind('.')
+            if last_period > chunk_size // 2:
+                chunk = chunk[:last_period + 1]
+                end = start + last_period + 1
+        chunks.append(chunk)
+        start = end - overlap
+    return chunks
+
+
+def _sentences(seed: int, n: int) -> str:
+    rng = random.Random(seed)
+    return " ".join(
+        "word " * rng.randint(1, 40) + "end." for _ in range(n)
+    )
+
+
+def test_short_text_is_a_single_chunk():
+    assert _chunk("A short holding.") == ["A short holding."]
+
+
+def test_breaks_after_the_last_period_in_the_second_half():
+    text = "a" * 70 + "." + "b" * 60
+    chunks = _chunk(text, chunk_size=100, overlap=10)
+    assert chunks[0] == "a" * 70 + "."
+    assert chunks[1].startswith(text[61:])
+
+
+def test_period_in_the_first_half_is_ignored():
+    text = "a" * 20 + "." + "b" * 150
+    chunks = _chunk(text, chunk_size=100, overlap=10)
+    assert chunks[0] == text[:100]
+
+
+def test_chunks_overlap_by_the_requested_amount():
+    text = "".join(chr(ord("a") + i % 26) for i in range(250))
+    chunks = _chunk(text, chunk_size=100, overlap=20)
+    # Each chunk starts `overlap` before the previous window's end, even when
+    # that window ran past the text, so the last chunk repeats the tail
+    assert chunks == [text[0:100], text[80:180], text[160:250], text[240:250]]
+
+
+@pytest.mark.parametrize("seed", range(20))
+@pytest.mark.parametrize("chunk_size,overlap", [(3000, 200), (500, 50), (101, 10)])
+def test_matches_the_original_slicing_implementation(seed, chunk_size, overlap):
+    text = _sentences(seed, 300)
+    assert _chunk(text, chunk_size=chunk_size, overlap=overlap) == _reference_chunk(
+        text, chunk_size=chunk_size, overlap=overlap
+    )
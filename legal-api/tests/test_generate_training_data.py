@@ -0,0 +1,114 @@
+"""Unit tests for the synthetic QA generator's batching helpers.
+
+Pure-function tests — no LLM, no MongoDB. Run with:
+    pytest legal-api/tests/test_generate_training_data.py -v
+"""
+
+import orjson
+import pytest
+
+import generate_training_data
+from generate_training_data import SyntheticDataGenerator, parse_batch_reply
+
+
+def _pair(n):
+    return {"instruction": f"Q{n}?", "output": f"A{n}."}
+
+
+def _reply(data) -> str:
+    return orjson.dumps(data).decode()
+
+
+class _CharEncoding:
+    """One token per character; stands in for tiktoken without the BPE download."""
+
+    def encode_batch(self, texts, disallowed_special=()):
+        return [[ord(c) for c in text] for text in texts]
+
+    def decode(self, tokens):
+        return "".join(map(chr, tokens))
+
+
+@pytest.fixture
+def generator(monkeypatch):
+    """A generator with only the token-budget state set (no Groq/Mongo clients)."""
+    monkeypatch.setattr(generate_training_data, "MAX_INPUT_TOKENS", 100)
+    monkeypatch.setattr(generate_training_data, "PROMPT_OVERHEAD_TOKENS", 10)
+    gen = SyntheticDataGenerator.__new__(SyntheticDataGenerator)
+    gen.encoding = _CharEncoding()
+    gen.system_prompt_tokens = 30
+    return gen
+
+
+# ───────────────────────── parse_batch_reply() ─────────────────────────
+
+
+def test_pairs_are_matched_to_contexts_by_id():
+    reply = _reply([
+        {"context_id": 2, "qa": [_pair(3)]},
+        {"context_id": 1, "qa": [_pair(1), _pair(2)]},
+    ])
+    assert parse_batch_reply(reply, 3) == [[_pair(1), _pair(2)], [_pair(3)], []]
+
+
+def test_fenced_reply_is_unwrapped():
+    reply = "Here you go:\n```json\n" + _reply([{"context_id": 1, "qa": [_pair(1)]}]) + "\n```"
+    assert parse_batch_reply(reply, 1) == [[_pair(1)]]
+
+
+def test_unclosed_fence_is_unwrapped():
+    reply = "```json\n" + _reply([{"context_id": 1, "qa": [_pair(1)]}])
+    assert parse_batch_reply(reply, 1) == [[_pair(1)]]
+
+
+@pytest.mark.parametrize("context_id", [0, 3, -1, "1", None])
+def test_out_of_range_or_non_int_context_id_is_dropped(context_id):
+    reply = _reply([{"context_id": context_id, "qa": [_pair(1)]}])
+    assert parse_batch_reply(reply, 2) == [[], []]
+
+
+def test_flat_pairs_go_to_first_context():
+    reply = _reply([_pair(1), {"context_id": 2, "qa": [_pair(2)]}])
+    assert parse_batch_reply(reply, 2) == [[_pair(1)], [_pair(2)]]
+
+
+def test_single_object_reply_is_treated_as_a_list():
+    reply = _reply({"context_id": 1, "qa": [_pair(1)]})
+    assert parse_batch_reply(reply, 1) == [[_pair(1)]]
+
+
+def test_non_list_qa_is_wrapped():
+    reply = _reply([{"context_id": 1, "qa": _pair(1)}])
+    assert parse_batch_reply(reply, 1) == [[_pair(1)]]
+
+
+def test_non_dict_items_are_skipped_without_losing_the_rest():
+    reply = _reply([
+        "stray text",
+        42,
+        {"context_id": 1, "qa": [_pair(1), "not a pair"]},
+        {"context_id": 2, "qa": [_pair(2)]},
+    ])
+    assert parse_batch_reply(reply, 2) == [[_pair(1)], [_pair(2)]]
+
+
+def test_invalid_json_raises():
+    with pytest.raises(orjson.JSONDecodeError):
+        parse_batch_reply("not json at all", 1)
+
+
+# ───────────────────────── fit_to_budget() ─────────────────────────
+
+
+def test_short_contexts_are_untouched(generator):
+    assert generator.fit_to_budget(["a" * 10, "b" * 30]) == ["a" * 10, "b" * 30]
+
+
+def test_budget_is_shared_across_the_batch(generator):
+    # (100 - 30 - 10) // 2 = 30 tokens per context
+    fitted = generator.fit_to_budget(["a" * 50, "b" * 20])
+    assert fitted == ["a" * 30, "b" * 20]
+
+
+def test_single_context_gets_the_whole_budget(generator):
+    assert generator.fit_to_budget(["a" * 100]) == ["a" * 60]
@@ -10,6 +10,10 @@ Usage:
     
 Or with pytest:
     pytest tests/test_legal_ai_eval.py -v
+
+The tests share no state and spend their time waiting on the judge model, so
+they can be spread across workers with pytest-xdist:
+    pytest tests/test_legal_ai_eval.py -n auto
 """
 
 import pytest
@@ -0,0 +1,101 @@
+"""Unit tests for the legal document loader's on-disk parse cache.
+
+Uses tmp_path for both the corpus and the cache — no network. Run with:
+    pytest legal-api/tests/test_legal_parser.py -v
+"""
+
+import os
+
+import pytest
+
+from ghana_legal.infrastructure.parsing.legal_parser import LegalDocumentLoader
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    """A constitution/ subdirectory with two text files."""
+    target = tmp_path / "data" / "constitution"
+    target.mkdir(parents=True)
+    (target / "article_1.txt").write_text("Article 1. The sovereignty of Ghana.")
+    (target / "article_2.txt").write_text("Article 2. Enforcement of the Constitution.")
+    return tmp_path
+
+
+@pytest.fixture
+def parse_calls(monkeypatch):
+    """Record which files the loader actually parses."""
+    calls = []
+    original = LegalDocumentLoader._parse_file
+
+    def _counting_parse(self, file_path):
+        calls.append(file_path.name)
+        return original(self, file_path)
+
+    monkeypatch.setattr(LegalDocumentLoader, "_parse_file", _counting_parse)
+    return calls
+
+
+def _load(corpus):
+    # A fresh loader each time, so only the on-disk cache can skip parsing
+    loader = LegalDocumentLoader(data_dir=str(corpus / "data"), cache_dir=corpus / "cache")
+    return loader.load_expert_documents("constitutional", "Constitutional Expert")
+
+
+def _contents(docs):
+    return sorted(d.page_content for d in docs)
+
+
+def test_unchanged_corpus_is_served_from_cache(corpus, parse_calls):
+    first = _load(corpus)
+    assert sorted(parse_calls) == ["article_1.txt", "article_2.txt"]
+
+    parse_calls.clear()
+    second = _load(corpus)
+    assert parse_calls == []
+    assert _contents(second) == _contents(first)
+    assert all(d.metadata["expert_id"] == "constitutional" for d in second)
+
+
+def test_edited_file_invalidates_cache(corpus, parse_calls):
+    _load(corpus)
+    edited = corpus / "data" / "constitution" / "article_1.txt"
+    stat = edited.stat()
+    edited.write_text("Article 1. Amended.")
+    # Move mtime even on filesystems with coarse timestamps
+    os.utime(edited, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    parse_calls.clear()
+    docs = _load(corpus)
+    assert sorted(parse_calls) == ["article_1.txt", "article_2.txt"]
+    assert "Article 1. Amended." in _contents(docs)
+
+
+def test_added_file_invalidates_cache(corpus, parse_calls):
+    _load(corpus)
+    (corpus / "data" / "constitution" / "article_3.txt").write_text("Article 3. Defence.")
+
+    parse_calls.clear()
+    docs = _load(corpus)
+    assert "article_3.txt" in parse_calls
+    assert len(docs) == 3
+
+
+def test_stale_cache_entries_are_replaced(corpus, parse_calls):
+    _load(corpus)
+    (corpus / "data" / "constitution" / "article_3.txt").write_text("Article 3. Defence.")
+    _load(corpus)
+
+    cache_files = list((corpus / "cache" / "constitution").iterdir())
+    assert len(cache_files) == 1
+    assert cache_files[0].suffix == ".json"
+
+
+def test_corrupt_cache_falls_back_to_parsing(corpus, parse_calls):
+    _load(corpus)
+    (cache_file,) = (corpus / "cache" / "constitution").iterdir()
+    cache_file.write_text("{not json")
+
+    parse_calls.clear()
+    docs = _load(corpus)
+    assert len(parse_calls) == 2
+    assert len(docs) == 2
@@ -4,10 +4,11 @@ Ghana Legal Case PDF Downloader
 Downloads Supreme Court judgment PDFs from ghalii.org
 """
 
+import asyncio
 import os
 import re
 import time
-import requests
+import httpx
 from bs4 import BeautifulSoup
 from pathlib import Path
 from urllib.parse import urljoin
@@ -15,52 +16,73 @@ from urllib.parse import urljoin
 # Configuration
 BASE_URL = "https://ghalii.org"
 CASES_URL = "https://ghalii.org/judgments/GHASC/?q=&sort=-date"
+CASE_LINK_SELECTOR = "a[href*='/akn/gh/judgment/ghasc/']:not([href*='source'])"
 OUTPUT_DIR = Path("/Users/silasgah/Documents/llm/agents_project/philoagents-course/ghana-legal-ai/data/cases")
 MAX_CASES = 50  # Start with 50 for testing
-DELAY_SECONDS = 0.5  # Be respectful to the server
+DELAY_SECONDS = 0.5  # Minimum gap between request starts, to be respectful to the server
+MAX_CONCURRENT_DOWNLOADS = 6
+CHUNK_SIZE = 64 * 1024
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) GhanaLegalAI/1.0"
+}
 
 def get_case_links(page_url: str, max_cases: int = 100) -> list[dict]:
     """Extract case page links from the listing page."""
     print(f"📄 Fetching case listing from: {page_url}")
     
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) GhanaLegalAI/1.0"
-    }
-    
-    response = requests.get(page_url, headers=headers)
+    response = httpx.get(page_url, headers=HEADERS, timeout=30, follow_redirects=True)
     response.raise_for_status()
     
-    soup = BeautifulSoup(response.text, 'html.parser')
+    soup = BeautifulSoup(response.content, 'lxml')
     
-    cases = []
-    # Find all links that match the case URL pattern
-    for link in soup.find_all('a', href=True):
+    seen: set[str] = set()
+    cases: list[dict] = []
+    # Let the compiled selector filter case links instead of testing every <a>
+    for link in soup.select(CASE_LINK_SELECTOR):
         href = link['href']
-        if '/akn/gh/judgment/ghasc/' in href and 'source' not in href:
-            # Extract case info
-            case_text = link.get_text(strip=True)
-            if case_text and '[' in case_text:  # Valid case citation
-                cases.append({
-                    'url': urljoin(BASE_URL, href),
-                    'title': case_text,
-                    'pdf_url': urljoin(BASE_URL, href + '/source.pdf')
-                })
+        # Extract case info
+        case_text = link.get_text(strip=True)
+        if case_text and '[' in case_text:  # Valid case citation
+            full_url = urljoin(BASE_URL, href)
+            if full_url in seen:
+                continue
+            seen.add(full_url)
+            cases.append({
+                'url': full_url,
+                'title': case_text,
+                'pdf_url': urljoin(BASE_URL, href + '/source.pdf')
+            })
                 
         if len(cases) >= max_cases:
             break
     
-    # Remove duplicates
-    seen = set()
-    unique_cases = []
-    for case in cases:
-        if case['url'] not in seen:
-            seen.add(case['url'])
-            unique_cases.append(case)
-    
-    print(f"✅ Found {len(unique_cases)} unique cases")
-    return unique_cases
+    print(f"✅ Found {len(cases)} unique cases")
+    return cases
+
+class _RequestPacer:
+    """Spaces request starts DELAY_SECONDS apart across all concurrent downloads."""
+
+    def __init__(self, interval: float = DELAY_SECONDS):
+        self.interval = interval
+        self._lock = asyncio.Lock()
+        self._next_slot = 0.0
+
+    async def wait(self):
+        async with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
 
-def download_pdf(case: dict, output_dir: Path) -> bool:
+async def download_pdf(
+    case: dict,
+    output_dir: Path,
+    client: httpx.AsyncClient,
+    sem: asyncio.Semaphore,
+    pacer: _RequestPacer,
+) -> bool:
     """Download a single PDF."""
     # Create safe filename from title
     safe_title = re.sub(r'[^\w\s-]', '', case['title'])[:80]
@@ -72,22 +94,46 @@ def download_pdf(case: dict, output_dir: Path) -> bool:
         print(f"⏭️  Already exists: {filename}")
         return True
     
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) GhanaLegalAI/1.0"
-    }
-    
-    try:
-        response = requests.get(case['pdf_url'], headers=headers, timeout=30)
-        if response.status_code == 200 and 'application/pdf' in response.headers.get('content-type', ''):
-            filepath.write_bytes(response.content)
-            print(f"✅ Downloaded: {filename} ({len(response.content) / 1024:.1f} KB)")
+    async with sem:
+        await pacer.wait()
+        try:
+            async with client.stream("GET", case['pdf_url']) as response:
+                if response.status_code != 200 or 'application/pdf' not in response.headers.get('content-type', ''):
+                    print(f"❌ Failed: {filename} (Status: {response.status_code})")
+                    return False
+                
+                # Stream to disk so peak memory is one chunk, not the whole PDF
+                written = 0
+                with open(filepath, 'wb') as f:
+                    async for chunk in response.aiter_bytes(CHUNK_SIZE):
+                        f.write(chunk)
+                        written += len(chunk)
+            print(f"✅ Downloaded: {filename} ({written / 1024:.1f} KB)")
             return True
-        else:
-            print(f"❌ Failed: {filename} (Status: {response.status_code})")
+        except Exception as e:
+            # A partial PDF would pass the filepath.exists() check on the next run
+            filepath.unlink(missing_ok=True)
+            print(f"❌ Error downloading {filename}: {e}")
             return False
-    except Exception as e:
-        print(f"❌ Error downloading {filename}: {e}")
-        return False
+
+async def download_all(cases: list[dict], output_dir: Path) -> int:
+    """Download every case's PDF concurrently; returns the number that succeeded."""
+    sem = asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
+    pacer = _RequestPacer()
+    limits = httpx.Limits(max_connections=MAX_CONCURRENT_DOWNLOADS)
+    
+    # One pooled HTTP/2 connection multiplexes the downloads instead of a
+    # TCP+TLS handshake per PDF; httpx negotiates gzip on its own
+    async with httpx.AsyncClient(
+        http2=True, headers=HEADERS, limits=limits, timeout=30, follow_redirects=True
+    ) as client:
+        
+        async def _download(i: int, case: dict) -> bool:
+            print(f"\n[{i}/{len(cases)}] {case['title'][:60]}...")
+            return await download_pdf(case, output_dir, client, sem, pacer)
+        
+        results = await asyncio.gather(*(_download(i, case) for i, case in enumerate(cases, 1)))
+    return sum(results)
 
 def main():
     """Main function to download all cases."""
@@ -107,13 +153,7 @@ def main():
     
     # Download PDFs
     print(f"\n📥 Downloading {len(cases)} PDFs...")
-    successful = 0
-    
-    for i, case in enumerate(cases, 1):
-        print(f"\n[{i}/{len(cases)}] {case['title'][:60]}...")
-        if download_pdf(case, OUTPUT_DIR):
-            successful += 1
-        time.sleep(DELAY_SECONDS)  # Be respectful
+    successful = asyncio.run(download_all(cases, OUTPUT_DIR))
     
     print(f"\n✅ Complete! Downloaded {successful}/{len(cases)} PDFs")
     print(f"📁 Files saved to: {OUTPUT_DIR}")